@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from pathlib import Path
+import time
 
 try:
     from importlib.metadata import version
@@ -14,22 +15,50 @@ except Exception:
 
 
 def is_unc_path(p: str) -> bool:
-    """Check if a path is a UNC network path (\\\\server\\share)."""
-    normalized = p.replace("/", "\\")
-    return normalized.startswith("\\\\")
+    """Check if a path is a UNC network path (\\\\server\\share).
+
+    Only the first two characters matter, so test them directly instead
+    of allocating a separator-normalized copy of the whole string.
+    """
+    return len(p) >= 2 and p[0] in "\\/" and p[1] in "\\/"
+
+
+@functools.lru_cache(maxsize=256)
+def _is_dir_at_epoch(path: str, epoch: int) -> bool:
+    return os.path.isdir(path)
+
+
+def is_dir_cached(path: str) -> bool:
+    """os.path.isdir with a short-lived memo to avoid repeated stats.
+
+    Keyed by a ~10 second epoch so rapid retries on the same path skip
+    the syscall while stale answers age out on their own.
+    """
+    return _is_dir_at_epoch(path, int(time.monotonic() // 10))
 
 
 def validate_paths(paths: list[str]) -> tuple[list[str], list[str]]:
     """Validate paths. Returns (valid_paths, invalid_paths).
 
-    UNC paths (\\\\server\\share) skip the is_dir() check because
+    UNC paths (\\\\server\\share) skip the directory check because
     they may require authentication that only Explorer can trigger.
+
+    Uses os.path.isdir (a single stat) instead of a Path object, and
+    caches results so duplicate inputs are only stat'ed once.
     """
     valid: list[str] = []
     invalid: list[str] = []
+    checked: dict[str, bool] = {}
+    expanduser = os.path.expanduser
+    isdir = os.path.isdir
     for p in paths:
-        expanded = os.path.expanduser(p)
-        if is_unc_path(expanded) or Path(expanded).is_dir():
+        # expanduser only acts on a leading ~; skip the call otherwise
+        expanded = expanduser(p) if p.startswith("~") else p
+        ok = checked.get(expanded)
+        if ok is None:
+            ok = is_unc_path(expanded) or isdir(expanded)
+            checked[expanded] = ok
+        if ok:
             valid.append(expanded)
         else:
             invalid.append(p)
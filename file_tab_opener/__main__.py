@@ -7,16 +7,35 @@ Entry point. Supports both `python -m file_tab_opener` and console_scripts.
 
 from __future__ import annotations
 
+import argparse
+import atexit
+import functools
+import importlib
 import logging
 import logging.handlers
 import os
 import platform
+import queue
 import sys
 from types import ModuleType
 
+# Platform name, resolved once at import
+_SYSTEM = platform.system()
+
+# Platform -> opener module (imported lazily on first use)
+_OPENER_MODULES = {
+    "Windows": "file_tab_opener.opener_win",
+    "Darwin": "file_tab_opener.opener_mac",
+}
+
 
 def _setup_logging() -> None:
-    """Configure logging with console and file handlers."""
+    """Configure logging with console and file handlers.
+
+    Handlers are fed through a QueueHandler/QueueListener pair so that
+    disk writes (RotatingFileHandler size checks and rotation) happen on
+    a background thread instead of blocking the Tk main thread.
+    """
     log_fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     date_fmt = "%Y-%m-%d %H:%M:%S"
 
@@ -27,17 +46,18 @@ def _setup_logging() -> None:
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
     console.setFormatter(logging.Formatter(log_fmt, datefmt=date_fmt))
-    root_logger.addHandler(console)
+    handlers: list[logging.Handler] = [console]
 
     # File output (DEBUG and above)
+    log_path: str | None = None
+    file_error: Exception | None = None
     try:
-        system = platform.system()
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             log_dir = os.path.join(
                 os.environ.get("APPDATA", os.path.expanduser("~")),
                 "FileTabOpener",
             )
-        elif system == "Darwin":
+        elif _SYSTEM == "Darwin":
             log_dir = os.path.join(os.path.expanduser("~"), "Library", "Logs", "FileTabOpener")
         else:
             log_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "FileTabOpener")
@@ -49,28 +69,57 @@ def _setup_logging() -> None:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(logging.Formatter(log_fmt, datefmt=date_fmt))
-        root_logger.addHandler(file_handler)
-        logging.getLogger(__name__).info("Log file: %s", log_path)
+        handlers.append(file_handler)
     except Exception as e:
-        logging.getLogger(__name__).warning("Failed to create log file: %s", e)
+        file_error = e
+
+    # The main thread only pushes records to the in-memory queue; the
+    # listener thread owns the real handlers and does the actual I/O.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    if log_path is not None:
+        logging.getLogger(__name__).info("Log file: %s", log_path)
+    if file_error is not None:
+        logging.getLogger(__name__).warning("Failed to create log file: %s", file_error)
 
 
+@functools.cache
 def _get_opener() -> ModuleType:
-    """Import and return the platform-specific opener module."""
-    system = platform.system()
-    if system == "Windows":
-        from file_tab_opener import opener_win as opener
-        return opener
-    elif system == "Darwin":
-        from file_tab_opener import opener_mac as opener
-        return opener
-    else:
-        print(f"Unsupported platform: {system}", file=sys.stderr)
+    """Import and return the platform-specific opener module (once per process)."""
+    module_name = _OPENER_MODULES.get(_SYSTEM)
+    if module_name is None:
+        print(f"Unsupported platform: {_SYSTEM}", file=sys.stderr)
         sys.exit(1)
+    return importlib.import_module(module_name)
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Runs before any heavy import so that `--help` / `--version` return
+    without paying the Tk/customtkinter startup cost.
+    """
+    from file_tab_opener import __version__
+
+    parser = argparse.ArgumentParser(
+        prog="file-tab-opener",
+        description="Open multiple folders as tabs in Windows Explorer or macOS Finder.",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}",
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
     """Application entry point."""
+    _parse_args()
     _setup_logging()
     log = logging.getLogger(__name__)
 
@@ -92,7 +141,7 @@ def main() -> None:
 
     # Import platform-specific opener
     opener = _get_opener()
-    log.info("Platform: %s, opener: %s", platform.system(), opener.__name__)
+    log.info("Platform: %s, opener: %s", _SYSTEM, opener.__name__)
 
     # Build and run GUI
     from file_tab_opener.main_window import MainWindow
@@ -7,11 +7,17 @@ to a JSON file. File location is OS-dependent.
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
 import logging
+import operator
 import os
 import platform
+import queue
 import re
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -19,27 +25,59 @@ from typing import Any, Final
 
 log = logging.getLogger(__name__)
 
+# Optional fast JSON codec: orjson parses/serializes UTF-8 bytes directly
+# and is several times faster than stdlib json. Fall back silently.
+try:
+    import orjson
+
+    def _json_dumps(d: dict[str, Any]) -> bytes:
+        return orjson.dumps(d, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(d: dict[str, Any]) -> bytes:
+        return json.dumps(d, ensure_ascii=False, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+_QUOTES: Final[tuple[str, str]] = ('"', "'")
+
 
 def strip_quotes(text: str) -> str:
     """Strip matching surrounding quotes (shell quoting artifacts).
 
     Shared utility used by both GUI (entry fields) and config (add_history).
     """
-    for quote in ('"', "'"):
-        if text.startswith(quote) and text.endswith(quote) and len(text) >= 2:
-            return text[1:-1]
+    if len(text) >= 2 and text[0] in _QUOTES and text[0] == text[-1]:
+        return text[1:-1]
     return text
 
 HISTORY_MAX: Final[int] = 50
 DEFAULT_SETTINGS: Final[dict[str, Any]] = {"use_custom_tk": True}
 
+# Trailing ' <digits>' suffix used by copy_tab_group naming
+_SUFFIX_RE: Final[re.Pattern[str]] = re.compile(r"^(.*?)\s+(\d+)$")
 
-def get_config_path() -> Path:
-    """Return the OS-specific configuration file path."""
-    system = platform.system()
-    if system == "Darwin":
+# Platform name, resolved once at import (platform.system() dispatches
+# through uname/registry lookups on first call)
+_SYSTEM: Final[str] = platform.system()
+
+# Serialization key order for _to_dict; attrgetter is C-implemented and
+# reads all fields of an entry in one call.
+_HISTORY_KEYS: Final[tuple[str, ...]] = ("path", "pinned", "last_used", "use_count")
+_HISTORY_GET = operator.attrgetter(*_HISTORY_KEYS)
+_TAB_GROUP_KEYS: Final[tuple[str, ...]] = (
+    "name", "paths", "window_x", "window_y", "window_width", "window_height",
+)
+_TAB_GROUP_GET = operator.attrgetter(*_TAB_GROUP_KEYS)
+
+
+def _compute_config_path() -> Path:
+    """Compute the OS-specific configuration file path."""
+    if _SYSTEM == "Darwin":
         return Path.home() / "Library" / "Application Support" / "FileTabOpener" / "config.json"
-    elif system == "Windows":
+    elif _SYSTEM == "Windows":
         appdata = os.environ.get("APPDATA", "")
         if appdata:
             return Path(appdata) / "FileTabOpener" / "config.json"
@@ -49,7 +87,15 @@ def get_config_path() -> Path:
         return Path.home() / ".config" / "file_tab_opener" / "config.json"
 
 
-@dataclass
+_CONFIG_PATH: Final[Path] = _compute_config_path()
+
+
+def get_config_path() -> Path:
+    """Return the OS-specific configuration file path (computed once)."""
+    return _CONFIG_PATH
+
+
+@dataclass(slots=True)
 class HistoryEntry:
     """A single history entry with path, pin state, and usage tracking."""
 
@@ -64,7 +110,7 @@ class HistoryEntry:
         self.use_count += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TabGroup:
     """A named group of folder paths."""
 
@@ -76,7 +122,7 @@ class TabGroup:
     window_height: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application-wide configuration data."""
 
@@ -88,11 +134,33 @@ class AppConfig:
 
 
 class ConfigManager:
-    """Manages configuration read/write and history/tab-group operations."""
+    """Manages configuration read/write and history/tab-group operations.
+
+    Mutators (add_history, toggle_pin, the tab-group operations, ...)
+    only touch in-memory state and never write to disk themselves;
+    callers batch any number of mutations and call save() exactly once.
+    This keeps multi-step interactions (e.g. pin = add + toggle) at a
+    single serialization per user action.
+    """
 
     def __init__(self) -> None:
         self.path: Path = get_config_path()
         self.data: AppConfig = AppConfig()
+        self._history_index: dict[str, HistoryEntry] = {}
+        self._tab_group_index: dict[str, TabGroup] = {}
+        self._last_saved_digest: bytes | None = None
+        # Lazily started writer thread + queue for schedule_save().
+        # The lock serializes disk writes between the writer thread and
+        # synchronous save(); the sequence numbers make writes monotonic
+        # so a stale queued snapshot can never clobber a newer one.
+        self._save_queue: queue.SimpleQueue | None = None
+        self._write_lock = threading.Lock()
+        self._save_seq: int = 0
+        self._written_seq: int = 0
+        # Sorted-view cache, invalidated by bumping the version counter
+        self._history_version: int = 0
+        self._sorted_cache: list[HistoryEntry] = []
+        self._sorted_version: int = -1
 
     def load(self) -> None:
         """Load configuration from file. Use defaults if the file is missing or corrupt."""
@@ -100,8 +168,7 @@ class ConfigManager:
             log.debug("Config file not found, using defaults: %s", self.path)
             return
         try:
-            text = self.path.read_text(encoding="utf-8")
-            d = json.loads(text)
+            d = _json_loads(self.path.read_bytes())
             self.data = self._from_dict(d)
             log.debug(
                 "Config loaded: %d history, %d tab groups",
@@ -110,60 +177,121 @@ class ConfigManager:
         except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
             log.warning("Config file is corrupt, using defaults: %s", e)
             self.data = AppConfig()
+        self._rebuild_history_index()
+        self._rebuild_tab_group_index()
 
     def save(self) -> None:
-        """Write configuration to file atomically (tmp -> rename).
+        """Write configuration to file atomically (tmp -> fsync -> rename).
 
-        Creates parent directories if needed.
+        Creates parent directories if needed. Skips the write entirely
+        when the serialized content is identical to the last save.
         """
+        self._save_seq += 1
+        self._write_bytes(_json_dumps(self._to_dict()), self._save_seq)
+
+    def schedule_save(self) -> None:
+        """Queue an asynchronous save and return immediately.
+
+        Serialization happens here on the caller's thread (cheap, and it
+        sees a consistent snapshot without locking); the blocking
+        write + fsync runs on a daemon writer thread. Bursts coalesce:
+        the writer drains the queue and only the newest snapshot hits
+        disk. Use save() where the write must complete before returning
+        (e.g. on application exit).
+        """
+        raw = _json_dumps(self._to_dict())
+        self._save_seq += 1
+        if self._save_queue is None:
+            self._save_queue = queue.SimpleQueue()
+            threading.Thread(
+                target=self._save_worker, name="config-save", daemon=True
+            ).start()
+        self._save_queue.put((self._save_seq, raw))
+
+    def _save_worker(self) -> None:
+        """Writer-thread loop: drain queued snapshots, write the newest."""
+        q = self._save_queue
+        assert q is not None
+        while True:
+            seq, raw = q.get()
+            try:
+                while True:
+                    seq, raw = q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._write_bytes(raw, seq)
+            except Exception as e:
+                log.error("Background config save failed: %s", e)
+
+    def _write_bytes(self, raw: bytes, seq: int) -> None:
+        """Atomically write serialized config bytes (digest-deduplicated).
+
+        Writes are serialized under a lock and ordered by sequence
+        number, so a concurrent synchronous save() always wins over an
+        older snapshot still queued for the writer thread.
+        """
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return
+            self._written_seq = seq
+            self._write_bytes_locked(raw)
+
+    def _write_bytes_locked(self, raw: bytes) -> None:
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        if digest == self._last_saved_digest:
+            log.debug("Config unchanged, save skipped: %s", self.path)
+            return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        d = self._to_dict()
-        text = json.dumps(d, ensure_ascii=False, indent=2)
         tmp_path = self.path.with_suffix(".tmp")
         try:
-            tmp_path.write_text(text, encoding="utf-8")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, raw)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             os.replace(tmp_path, self.path)
         except OSError:
             # Fallback: direct write if rename fails (e.g. cross-device)
             log.warning("Atomic rename failed, falling back to direct write")
-            self.path.write_text(text, encoding="utf-8")
+            self.path.write_bytes(raw)
+        self._last_saved_digest = digest
         log.debug("Config saved: %s", self.path)
 
     def _to_dict(self) -> dict[str, Any]:
-        """Serialize AppConfig to a dictionary."""
+        """Serialize AppConfig to a dictionary.
+
+        The result is only ever read by the JSON encoder in save(), so
+        list/dict fields are referenced directly instead of copied.
+        """
         return {
             "config_version": self.data.config_version,
             "history": [
-                {
-                    "path": e.path,
-                    "pinned": e.pinned,
-                    "last_used": e.last_used,
-                    "use_count": e.use_count,
-                }
+                dict(zip(_HISTORY_KEYS, _HISTORY_GET(e)))
                 for e in self.data.history
             ],
             "tab_groups": [
-                {
-                    "name": g.name,
-                    "paths": list(g.paths),
-                    "window_x": g.window_x,
-                    "window_y": g.window_y,
-                    "window_width": g.window_width,
-                    "window_height": g.window_height,
-                }
+                dict(zip(_TAB_GROUP_KEYS, _TAB_GROUP_GET(g)))
                 for g in self.data.tab_groups
             ],
             "window_geometry": self.data.window_geometry,
-            "settings": dict(self.data.settings),
+            "settings": self.data.settings,
         }
 
     @staticmethod
     def _from_dict(d: dict[str, Any]) -> AppConfig:
-        """Deserialize a dictionary into AppConfig. Handles missing keys gracefully."""
+        """Deserialize a dictionary into AppConfig. Handles missing keys gracefully.
+
+        Paths are normalized here, once at load; mutators normalize at
+        insert. Every later comparison (history index, dedup) is then a
+        plain string equality with no normpath on the query path.
+        """
+        normpath = os.path.normpath
         history: list[HistoryEntry] = []
         for item in d.get("history", []):
             history.append(HistoryEntry(
-                path=item.get("path", ""),
+                path=normpath(item.get("path", "")),
                 pinned=item.get("pinned", False),
                 last_used=item.get("last_used", ""),
                 use_count=item.get("use_count", 0),
@@ -175,7 +303,7 @@ class ConfigManager:
             paths = item.get("paths", item.get("folders", []))
             tab_groups.append(TabGroup(
                 name=item.get("name", ""),
-                paths=list(paths),
+                paths=[normpath(p) for p in paths],
                 window_x=item.get("window_x"),
                 window_y=item.get("window_y"),
                 window_width=item.get("window_width"),
@@ -192,28 +320,44 @@ class ConfigManager:
 
     # --- History operations ---
 
+    def _rebuild_history_index(self) -> None:
+        """Rebuild the path -> entry index after bulk changes.
+
+        Entry paths are already normalized (at load and at insert), so
+        they key the index directly.
+        """
+        self._history_index = {e.path: e for e in self.data.history}
+        self._history_version += 1
+
     def add_history(self, path: str) -> None:
         """Add a path to history. Updates existing entry or appends a new one."""
         clean = strip_quotes(path.strip())
         normalized = os.path.normpath(clean)
-        for entry in self.data.history:
-            if os.path.normpath(entry.path) == normalized:
-                entry.touch()
-                log.debug("History updated (existing): %s", normalized)
-                return
+        entry = self._history_index.get(normalized)
+        if entry is not None:
+            entry.touch()
+            self._history_version += 1
+            log.debug("History updated (existing): %s", normalized)
+            return
         new_entry = HistoryEntry(path=normalized)
         new_entry.touch()
         self.data.history.append(new_entry)
+        self._history_index[normalized] = new_entry
+        self._history_version += 1
         self._trim_history()
         log.debug("History added (new): %s", normalized)
 
+    def has_history(self, path: str) -> bool:
+        """Return True if the path (normalized) is already in history."""
+        return os.path.normpath(path) in self._history_index
+
     def remove_history(self, path: str) -> None:
         """Remove a path from history."""
         normalized = os.path.normpath(path)
-        self.data.history = [
-            e for e in self.data.history
-            if os.path.normpath(e.path) != normalized
-        ]
+        entry = self._history_index.pop(normalized, None)
+        if entry is not None:
+            self.data.history.remove(entry)
+            self._history_version += 1
 
     def clear_history(self, *, keep_pinned: bool = True) -> None:
         """Clear history. If keep_pinned is True, pinned entries are preserved."""
@@ -222,49 +366,71 @@ class ConfigManager:
             self.data.history = [e for e in self.data.history if e.pinned]
         else:
             self.data.history.clear()
+        self._rebuild_history_index()
         log.info("History cleared: %d -> %d entries (keep_pinned=%s)", before, len(self.data.history), keep_pinned)
 
     def toggle_pin(self, path: str) -> None:
         """Toggle the pinned state of a history entry."""
         normalized = os.path.normpath(path)
-        for entry in self.data.history:
-            if os.path.normpath(entry.path) == normalized:
-                entry.pinned = not entry.pinned
-                log.debug("Pin toggled: %s -> pinned=%s", normalized, entry.pinned)
-                return
+        entry = self._history_index.get(normalized)
+        if entry is not None:
+            entry.pinned = not entry.pinned
+            self._history_version += 1
+            log.debug("Pin toggled: %s -> pinned=%s", normalized, entry.pinned)
+            return
         log.debug("toggle_pin: path not found in history: %s", normalized)
 
+    @property
+    def history_version(self) -> int:
+        """Monotonic counter bumped on every history mutation.
+
+        Lets callers cache derived views (e.g. formatted dropdown rows)
+        and invalidate them only when history actually changed.
+        """
+        return self._history_version
+
     def get_sorted_history(self) -> list[HistoryEntry]:
-        """Return history sorted with pinned first, each group by most recent."""
-        pinned = sorted(
-            [e for e in self.data.history if e.pinned],
-            key=lambda e: e.last_used,
-            reverse=True,
-        )
-        unpinned = sorted(
-            [e for e in self.data.history if not e.pinned],
-            key=lambda e: e.last_used,
-            reverse=True,
-        )
-        return pinned + unpinned
+        """Return history sorted with pinned first, each group by most recent.
+
+        The result is cached until the next history mutation; callers
+        must treat the returned list as read-only.
+        """
+        if self._sorted_version == self._history_version:
+            return self._sorted_cache
+        pinned: list[HistoryEntry] = []
+        unpinned: list[HistoryEntry] = []
+        for e in self.data.history:
+            (pinned if e.pinned else unpinned).append(e)
+        pinned.sort(key=lambda e: e.last_used, reverse=True)
+        unpinned.sort(key=lambda e: e.last_used, reverse=True)
+        self._sorted_cache = pinned + unpinned
+        self._sorted_version = self._history_version
+        return self._sorted_cache
 
     def _trim_history(self) -> None:
         """Remove the oldest unpinned entries when history exceeds HISTORY_MAX.
 
-        O(n log n) implementation: sort unpinned by last_used descending,
-        keep only the newest ones, then recombine with pinned entries.
+        Uses heapq.nlargest for an O(n log k) partial selection of the
+        newest unpinned entries instead of a full sort.
         """
         if len(self.data.history) <= HISTORY_MAX:
             return
-        pinned = [e for e in self.data.history if e.pinned]
-        unpinned = [e for e in self.data.history if not e.pinned]
+        pinned: list[HistoryEntry] = []
+        unpinned: list[HistoryEntry] = []
+        for e in self.data.history:
+            (pinned if e.pinned else unpinned).append(e)
         keep_count = max(HISTORY_MAX - len(pinned), 0)
-        # Sort unpinned by last_used descending, keep newest
-        unpinned.sort(key=lambda e: e.last_used, reverse=True)
-        self.data.history = pinned + unpinned[:keep_count]
+        # Newest unpinned entries by last_used (descending)
+        kept = heapq.nlargest(keep_count, unpinned, key=lambda e: e.last_used)
+        self.data.history = pinned + kept
+        self._rebuild_history_index()
 
     # --- Tab group operations ---
 
+    def _rebuild_tab_group_index(self) -> None:
+        """Rebuild the name -> group index after bulk changes."""
+        self._tab_group_index = {g.name: g for g in self.data.tab_groups}
+
     def add_tab_group(self, name: str) -> TabGroup | None:
         """Create a new empty tab group. Returns None if the name already exists or is empty."""
         if not name or not name.strip():
@@ -275,29 +441,29 @@ class ConfigManager:
             return None
         group = TabGroup(name=name)
         self.data.tab_groups.append(group)
+        self._tab_group_index[name] = group
         log.info("Tab group added: %s", name)
         return group
 
     def delete_tab_group(self, name: str) -> None:
         """Delete a tab group by name."""
         self.data.tab_groups = [g for g in self.data.tab_groups if g.name != name]
+        self._tab_group_index.pop(name, None)
         log.info("Tab group deleted: %s", name)
 
     def rename_tab_group(self, old_name: str, new_name: str) -> None:
         """Rename a tab group."""
-        for group in self.data.tab_groups:
-            if group.name == old_name:
-                group.name = new_name
-                log.info("Tab group renamed: %s -> %s", old_name, new_name)
-                return
+        group = self._tab_group_index.pop(old_name, None)
+        if group is not None:
+            group.name = new_name
+            self._tab_group_index[new_name] = group
+            log.info("Tab group renamed: %s -> %s", old_name, new_name)
+            return
         log.debug("rename_tab_group: not found: %s", old_name)
 
     def get_tab_group(self, name: str) -> TabGroup | None:
         """Get a tab group by name. Returns None if not found."""
-        for group in self.data.tab_groups:
-            if group.name == name:
-                return group
-        return None
+        return self._tab_group_index.get(name)
 
     def add_path_to_group(self, group_name: str, path: str) -> None:
         """Add a path to a tab group."""
@@ -307,6 +473,26 @@ class ConfigManager:
             group.paths.append(normalized)
             log.debug("Path added to group '%s': %s", group_name, normalized)
 
+    def add_paths_to_group(self, group_name: str, paths: Iterable[str]) -> None:
+        """Add multiple paths to a tab group in one pass.
+
+        Normalizes each path once and skips paths the group already
+        contains; preferred over looping add_path_to_group for bulk adds.
+        """
+        group = self.get_tab_group(group_name)
+        if not group:
+            return
+        normpath = os.path.normpath
+        existing = set(group.paths)
+        added = 0
+        for p in paths:
+            normalized = normpath(p)
+            if normalized not in existing:
+                group.paths.append(normalized)
+                existing.add(normalized)
+                added += 1
+        log.debug("Paths added to group '%s': %d new", group_name, added)
+
     def remove_path_from_group(self, group_name: str, index: int) -> None:
         """Remove a path from a tab group by index."""
         group = self.get_tab_group(group_name)
@@ -335,11 +521,17 @@ class ConfigManager:
             log.debug("copy_tab_group: source not found: %s", name)
             return None
         # Extract base name: strip trailing ' <digits>'
-        m = re.match(r'^(.*?)\s+(\d+)$', name)
+        m = _SUFFIX_RE.match(name)
         base = m.group(1) if m else name
-        existing_names = {g.name for g in self.data.tab_groups}
+        # Collect numeric suffixes already used for this base in one pass,
+        # then take the smallest free one (fills gaps).
+        used: set[int] = set()
+        for g in self.data.tab_groups:
+            gm = _SUFFIX_RE.match(g.name)
+            if gm and gm.group(1) == base:
+                used.add(int(gm.group(2)))
         suffix = 1
-        while f"{base} {suffix}" in existing_names:
+        while suffix in used:
             suffix += 1
         new_name = f"{base} {suffix}"
         new_group = TabGroup(
@@ -351,6 +543,7 @@ class ConfigManager:
             window_height=source.window_height,
         )
         self.data.tab_groups.append(new_group)
+        self._tab_group_index[new_name] = new_group
         log.info("Tab group copied: %s -> %s (%d paths)", name, new_name, len(new_group.paths))
         return new_group
 
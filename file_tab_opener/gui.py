@@ -4,10 +4,49 @@ GUI module for File Tab Opener.
 Re-exports public names from the split sub-modules.
 Import directly from the sub-modules (widgets, history, tab_group,
 main_window) for new code.
+
+Re-exports are resolved lazily (PEP 562) so that importing this module
+does not pull in the full tkinter/customtkinter stack.
 """
 
-from file_tab_opener.widgets import *  # noqa: F401, F403
-from file_tab_opener.widgets import _strip_quotes, _setup_placeholder  # noqa: F401
-from file_tab_opener.history import HistorySection  # noqa: F401
-from file_tab_opener.tab_group import TabGroupSection, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT  # noqa: F401
-from file_tab_opener.main_window import MainWindow  # noqa: F401
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# name -> sub-module that defines it
+_EXPORTS = {
+    "CTK_AVAILABLE": "file_tab_opener.widgets",
+    "IS_MAC": "file_tab_opener.widgets",
+    "IS_WIN": "file_tab_opener.widgets",
+    "is_dark_mode": "file_tab_opener.widgets",
+    "get_root": "file_tab_opener.widgets",
+    "Frame": "file_tab_opener.widgets",
+    "Button": "file_tab_opener.widgets",
+    "Label": "file_tab_opener.widgets",
+    "Entry": "file_tab_opener.widgets",
+    "TabView": "file_tab_opener.widgets",
+    "_strip_quotes": "file_tab_opener.widgets",
+    "_setup_placeholder": "file_tab_opener.widgets",
+    "HistorySection": "file_tab_opener.history",
+    "TabGroupSection": "file_tab_opener.tab_group",
+    "MIN_WINDOW_WIDTH": "file_tab_opener.tab_group",
+    "MIN_WINDOW_HEIGHT": "file_tab_opener.tab_group",
+    "MainWindow": "file_tab_opener.main_window",
+}
+
+__all__ = [name for name in _EXPORTS if not name.startswith("_")]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exported names on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache for subsequent lookups
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -11,10 +11,8 @@ import os
 import tkinter as tk
 import tkinter.ttk as ttk
 from collections.abc import Callable
-from pathlib import Path
-from tkinter import messagebox
 
-from file_tab_opener import is_unc_path
+from file_tab_opener import is_dir_cached, is_unc_path
 from typing import Any
 
 from file_tab_opener.config import ConfigManager
@@ -30,13 +28,15 @@ from file_tab_opener.widgets import (
     _strip_quotes,
     _setup_placeholder,
     _is_placeholder_active,
+    _listbox_colors,
+    _select_all_on_focus,
+    _update_placeholder,
 )
 
 log = logging.getLogger(__name__)
 
-# Dropdown value prefixes
-_PIN_PREFIX = "\U0001f4cc "   # 📌 + space (2 chars in Python)
-_UNPIN_PREFIX = "   "         # 3 spaces
+# Foreground color marking pinned rows in the dropdown
+_PIN_FG = "#e0a020"
 
 # Import ctk only when available
 if CTK_AVAILABLE:
@@ -57,11 +57,23 @@ class HistorySection:
         self._parent = parent
 
         self.frame = Frame(parent)
+        # The section is never reparented, so the toplevel is fixed
+        self._top = self.frame.winfo_toplevel()
         self._build_widgets()
 
+    def _register(self, widget: Any, key: str) -> Any:
+        """Track a widget whose text is re-applied by retranslate()."""
+        self._i18n_widgets.append((widget, key))
+        return widget
+
     def _build_widgets(self) -> None:
         """Build all widgets in the history section."""
-        Label(self.frame, text=t("history.label")).pack(side=tk.LEFT, padx=(0, 5))
+        # (widget, i18n key) pairs updated in place on language change
+        self._i18n_widgets: list[tuple[Any, str]] = []
+
+        self._register(
+            Label(self.frame, text=t("history.label")), "history.label"
+        ).pack(side=tk.LEFT, padx=(0, 5))
 
         # Entry with custom dropdown (cross-platform scrollable list)
         if is_dark_mode():
@@ -70,15 +82,16 @@ class HistorySection:
             entry_frame = ttk.Frame(self.frame)
         entry_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
 
+        # Resolve the placeholder once; focus handlers close over it and
+        # never re-query the i18n table per event
+        self._placeholder = t("path.placeholder")
         if CTK_AVAILABLE:
-            self.entry = ctk.CTkEntry(entry_frame, placeholder_text=t("path.placeholder"))
+            self.entry = ctk.CTkEntry(entry_frame, placeholder_text=self._placeholder)
         else:
             self.entry = ttk.Entry(entry_frame)
-            _setup_placeholder(self.entry, t("path.placeholder"))
+            _setup_placeholder(self.entry, self._placeholder)
             if IS_MAC:
-                self.entry.bind(
-                    "<FocusIn>", lambda e: e.widget.selection_range(0, tk.END), add="+",
-                )
+                self.entry.bind("<FocusIn>", _select_all_on_focus, add="+")
         self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # Dropdown toggle button
@@ -87,24 +100,138 @@ class HistorySection:
         )
         self._dropdown_btn.pack(side=tk.LEFT)
 
-        self._dropdown_win: tk.Toplevel | None = None
-        self._dropdown_listbox: tk.Listbox | None = None
+        self._dropdown_visible: bool = False
         self._dropdown_close_pending: bool = False
+        # Virtualized dropdown state: full (pinned, path) model list +
+        # index of the first visible row. Only the visible window is
+        # inserted into the Listbox.
+        self._all_values: list[tuple[bool, str]] = []
+        self._dropdown_top: int = 0
+        self._dropdown_rows: int = 0
+        # Dropdown rows, cached against the config's history_version
+        # so repeat opens skip the rebuild entirely.
+        self._cached_dropdown: list[tuple[bool, str]] = []
+        self._cached_dropdown_version: int = -1
+
+        # Resolve listbox theming once; appearance-mode changes are rare,
+        # so refresh the cached colors from a tracker callback instead of
+        # querying the mode on every dropdown open
+        self._listbox_bg, self._listbox_fg, self._listbox_sel = _listbox_colors()
+        if CTK_AVAILABLE:
+            try:
+                ctk.AppearanceModeTracker.add(self._on_appearance_changed)
+            except Exception as e:
+                log.debug("Appearance tracker unavailable: %s", e)
+
+        self._build_dropdown()
 
         open_key = "history.open_finder" if IS_MAC else "history.open_explorer"
-        Button(self.frame, text=t(open_key), command=self._on_open).pack(
-            side=tk.LEFT, padx=2
+        self._register(
+            Button(self.frame, text=t(open_key), command=self._on_open), open_key
+        ).pack(side=tk.LEFT, padx=2)
+        self._register(
+            Button(self.frame, text=t("history.pin"), command=self._on_pin, width=5),
+            "history.pin",
+        ).pack(side=tk.LEFT, padx=2)
+        self._register(
+            Button(self.frame, text=t("history.clear"), command=self._on_clear, width=6),
+            "history.clear",
+        ).pack(side=tk.LEFT, padx=2)
+
+        # Inline clear confirmation, hidden until Clear is clicked. A
+        # modal askyesno would re-enter the event loop and block the UI
+        # thread (including progress updates from a running open worker).
+        self._clear_confirm = Frame(self.frame)
+        self._clear_confirm_visible = False
+        self._register(
+            Label(self._clear_confirm, text=t("history.clear_confirm_msg")),
+            "history.clear_confirm_msg",
+        ).pack(side=tk.LEFT, padx=(4, 2))
+        self._register(
+            Button(
+                self._clear_confirm, text=t("history.clear_yes"),
+                command=self._on_clear_confirmed, width=4,
+            ),
+            "history.clear_yes",
+        ).pack(side=tk.LEFT, padx=2)
+        self._register(
+            Button(
+                self._clear_confirm, text=t("history.clear_no"),
+                command=self._hide_clear_confirm, width=4,
+            ),
+            "history.clear_no",
+        ).pack(side=tk.LEFT, padx=2)
+
+    def retranslate(self) -> None:
+        """Re-apply translated widget texts in place after a language change."""
+        for widget, key in self._i18n_widgets:
+            widget.configure(text=t(key))
+        self._placeholder = t("path.placeholder")
+        if CTK_AVAILABLE:
+            self.entry.configure(placeholder_text=self._placeholder)
+        else:
+            _update_placeholder(self.entry, self._placeholder)
+
+    def _build_dropdown(self) -> None:
+        """Create the dropdown Toplevel once, hidden.
+
+        The window and its listbox/scrollbars persist for the lifetime
+        of the section; opening only updates contents and geometry and
+        deiconifies, avoiding widget creation/destruction per toggle.
+        """
+        self._dropdown_win = tk.Toplevel(self.frame)
+        self._dropdown_win.wm_overrideredirect(True)
+        self._dropdown_win.withdraw()
+        self._dropdown_win.configure(bg=self._listbox_bg)
+
+        list_frame = ttk.Frame(self._dropdown_win)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=6)
+
+        self._dropdown_listbox = tk.Listbox(
+            list_frame, selectmode=tk.SINGLE, height=10,
+            borderwidth=0, highlightthickness=0,
+            bg=self._listbox_bg, fg=self._listbox_fg,
+            selectbackground=self._listbox_sel,
         )
-        Button(self.frame, text=t("history.pin"), command=self._on_pin, width=5).pack(
-            side=tk.LEFT, padx=2
+        # Virtualized list: the Listbox only ever holds the visible window,
+        # so vertical scrolling is driven by our own handler instead of yview.
+        self._dropdown_scrollbar_y = ttk.Scrollbar(
+            list_frame, orient=tk.VERTICAL, command=self._on_dropdown_scroll,
         )
-        Button(self.frame, text=t("history.clear"), command=self._on_clear, width=6).pack(
-            side=tk.LEFT, padx=2
+        self._dropdown_scrollbar_x = ttk.Scrollbar(
+            list_frame, orient=tk.HORIZONTAL, command=self._dropdown_listbox.xview,
         )
+        self._dropdown_listbox.configure(xscrollcommand=self._dropdown_scrollbar_x.set)
+        self._scrollbar_h: int | None = None
+        self._rendered_state: tuple[int, int, int, int] | None = None
+
+        self._dropdown_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self._dropdown_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self._dropdown_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._dropdown_listbox.bind("<MouseWheel>", self._on_dropdown_wheel)
+        self._dropdown_listbox.bind("<Button-4>", self._on_dropdown_wheel)
+        self._dropdown_listbox.bind("<Button-5>", self._on_dropdown_wheel)
+        self._dropdown_listbox.bind("<<ListboxSelect>>", self._on_dropdown_select)
+
+        # Close on click outside -- check listbox selection state before closing
+        self._dropdown_win.bind("<FocusOut>", self._on_dropdown_focus_out)
+
+    def _on_appearance_changed(self, _mode: str) -> None:
+        """Refresh cached listbox colors when the appearance mode changes."""
+        self._listbox_bg, self._listbox_fg, self._listbox_sel = _listbox_colors()
+        try:
+            self._dropdown_win.configure(bg=self._listbox_bg)
+            self._dropdown_listbox.configure(
+                bg=self._listbox_bg, fg=self._listbox_fg,
+                selectbackground=self._listbox_sel,
+            )
+        except (AttributeError, tk.TclError):
+            pass
 
     def _toggle_dropdown(self) -> None:
         """Show or hide the custom dropdown list."""
-        if self._dropdown_win and self._dropdown_win.winfo_exists():
+        if self._dropdown_visible:
             self._close_dropdown()
             return
         self._show_dropdown()
@@ -117,76 +244,93 @@ class HistorySection:
             return
         log.debug("Dropdown opened: %d entries", len(values))
 
-        self._dropdown_win = tk.Toplevel(self.frame)
-        self._dropdown_win.wm_overrideredirect(True)
+        self._all_values = values
+        self._dropdown_top = 0
+        self._dropdown_rows = min(len(values), 10)
 
-        # Position below the entry
-        x = self.entry.winfo_rootx()
-        y = self.entry.winfo_rooty() + self.entry.winfo_height()
-        width = self.entry.winfo_width() + self._dropdown_btn.winfo_width()
+        # Position below the entry. Each winfo_* method is its own Tcl
+        # round-trip; fetch all five values in a single eval instead.
+        e, b = str(self.entry), str(self._dropdown_btn)
+        geo = self.frame.tk.eval(
+            f"list [winfo rootx {e}] [winfo rooty {e}]"
+            f" [winfo height {e}] [winfo width {e}] [winfo width {b}]"
+        ).split()
+        x = int(geo[0])
+        y = int(geo[1]) + int(geo[2])
+        width = int(geo[3]) + int(geo[4])
 
-        # Calculate needed height (max 10 items)
-        row_count = min(len(values), 10)
-
-        # Background: match mode for dark/light
-        bg_color = "#ffffff"
-        if CTK_AVAILABLE:
-            try:
-                mode = ctk.get_appearance_mode()
-                if mode == "Dark":
-                    bg_color = "#2b2b2b"
-            except Exception as e:
-                log.debug("Theme detection failed: %s", e)
-        self._dropdown_win.configure(bg=bg_color)
-
-        list_frame = ttk.Frame(self._dropdown_win)
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=6)
-
-        self._dropdown_listbox = tk.Listbox(
-            list_frame, selectmode=tk.SINGLE, height=row_count,
-            borderwidth=0, highlightthickness=0,
-        )
-        scrollbar_y = ttk.Scrollbar(
-            list_frame, orient=tk.VERTICAL, command=self._dropdown_listbox.yview,
-        )
-        scrollbar_x = ttk.Scrollbar(
-            list_frame, orient=tk.HORIZONTAL, command=self._dropdown_listbox.xview,
-        )
-        self._dropdown_listbox.configure(
-            yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set,
-        )
-
-        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-        scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
-        self._dropdown_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        for v in values:
-            self._dropdown_listbox.insert(tk.END, v)
-
-        # Theme the listbox for customtkinter dark mode
-        if CTK_AVAILABLE:
-            try:
-                mode = ctk.get_appearance_mode()
-                if mode == "Dark":
-                    self._dropdown_listbox.configure(
-                        bg="#2b2b2b", fg="#ffffff", selectbackground="#1f6aa5",
-                    )
-            except Exception as e:
-                log.debug("Theme detection failed for listbox: %s", e)
-
-        self._dropdown_listbox.bind("<<ListboxSelect>>", self._on_dropdown_select)
+        self._dropdown_listbox.configure(height=self._dropdown_rows)
+        self._render_dropdown_window()
 
         # Size and position: measure actual listbox height for HiDPI support
         self._dropdown_win.update_idletasks()
         list_h = self._dropdown_listbox.winfo_reqheight()
         # Account for padding (8+8 horizontal, 6+6 vertical) and scrollbar
         pad_x, pad_y = 16, 12
-        scrollbar_h = scrollbar_x.winfo_reqheight()
-        total_h = list_h + scrollbar_h + pad_y
+        # The scrollbar's requested height never changes; measure once
+        if self._scrollbar_h is None:
+            self._scrollbar_h = self._dropdown_scrollbar_x.winfo_reqheight()
+        total_h = list_h + self._scrollbar_h + pad_y
         self._dropdown_win.geometry(f"{width + pad_x}x{total_h}+{x}+{y}")
 
-        # Close on click outside -- check listbox selection state before closing
-        self._dropdown_win.bind("<FocusOut>", self._on_dropdown_focus_out)
+        self._dropdown_win.deiconify()
+        self._dropdown_win.lift()
+        self._dropdown_visible = True
+
+    def _render_dropdown_window(self) -> None:
+        """Insert only the visible slice of the model into the Listbox."""
+        if not self._dropdown_listbox:
+            return
+        total = len(self._all_values)
+        top = self._dropdown_top
+        # Reopening with unchanged history and scroll position leaves the
+        # listbox exactly as it was; skip the delete/insert round-trips
+        state = (self._cached_dropdown_version, top, self._dropdown_rows, total)
+        if state == self._rendered_state:
+            return
+        self._rendered_state = state
+        self._dropdown_listbox.delete(0, tk.END)
+        window = self._all_values[top:top + self._dropdown_rows]
+        if window:
+            # Single variadic insert: one Tcl command instead of one per row
+            self._dropdown_listbox.insert(tk.END, *(path for _, path in window))
+            # Pinned rows are marked by color instead of a text prefix,
+            # so rows hold raw paths and selection needs no stripping
+            for i, (pinned, _) in enumerate(window):
+                if pinned:
+                    self._dropdown_listbox.itemconfigure(i, foreground=_PIN_FG)
+        if self._dropdown_scrollbar_y and total:
+            self._dropdown_scrollbar_y.set(
+                top / total, (top + self._dropdown_rows) / total,
+            )
+
+    def _scroll_dropdown_to(self, top: int) -> None:
+        """Clamp and apply a new top row index, re-rendering if it moved."""
+        top = max(0, min(top, len(self._all_values) - self._dropdown_rows))
+        if top != self._dropdown_top:
+            self._dropdown_top = top
+            self._render_dropdown_window()
+
+    def _on_dropdown_scroll(self, *args: str) -> None:
+        """Scrollbar command for the virtualized dropdown list."""
+        if args[0] == "moveto":
+            self._scroll_dropdown_to(round(float(args[1]) * len(self._all_values)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._dropdown_rows
+            self._scroll_dropdown_to(self._dropdown_top + step)
+
+    def _on_dropdown_wheel(self, event: Any) -> str:
+        """Mouse wheel over the virtualized dropdown list."""
+        if event.num == 4:        # X11 wheel up
+            step = -1
+        elif event.num == 5:      # X11 wheel down
+            step = 1
+        else:                     # Windows/macOS <MouseWheel>
+            step = -1 if event.delta > 0 else 1
+        self._scroll_dropdown_to(self._dropdown_top + step)
+        return "break"
 
     def _on_dropdown_focus_out(self, _event: Any) -> None:
         """Handle FocusOut on dropdown -- delay close to avoid racing with selection."""
@@ -204,13 +348,13 @@ class HistorySection:
         self.frame.after(100, self._close_dropdown)
 
     def _close_dropdown(self) -> None:
-        """Close the custom dropdown."""
+        """Hide the custom dropdown (the widgets persist for reuse)."""
         self._dropdown_close_pending = False
-        if self._dropdown_win and self._dropdown_win.winfo_exists():
-            self._dropdown_win.destroy()
+        if self._dropdown_visible:
+            self._dropdown_win.withdraw()
+            self._dropdown_listbox.selection_clear(0, tk.END)
+            self._dropdown_visible = False
             log.debug("Dropdown closed")
-        self._dropdown_win = None
-        self._dropdown_listbox = None
 
     def _on_dropdown_select(self, _event: Any) -> None:
         """Handle selection from the custom dropdown."""
@@ -220,34 +364,29 @@ class HistorySection:
         if not sel:
             return
         value = self._dropdown_listbox.get(sel[0])
-        # Strip display prefix (📌 or spaces) to get the raw path
-        if value.startswith(_PIN_PREFIX):
-            value = value[len(_PIN_PREFIX):]
-        elif value.startswith(_UNPIN_PREFIX):
-            value = value[len(_UNPIN_PREFIX):]
         self.entry.delete(0, tk.END)
         self.entry.insert(0, value)
         self._close_dropdown()
 
-    def _get_dropdown_values(self) -> list[str]:
-        """Build the dropdown value list from history."""
-        history = self.config.get_sorted_history()
-        values: list[str] = []
-        for entry in history:
-            prefix = _PIN_PREFIX if entry.pinned else _UNPIN_PREFIX
-            values.append(f"{prefix}{entry.path}")
+    def _get_dropdown_values(self) -> list[tuple[bool, str]]:
+        """Build (pinned, path) dropdown rows from history (cached per version)."""
+        version = self.config.history_version
+        if version == self._cached_dropdown_version:
+            return self._cached_dropdown
+        values = [(e.pinned, e.path) for e in self.config.get_sorted_history()]
+        self._cached_dropdown = values
+        self._cached_dropdown_version = version
         return values
 
     def _get_selected_path(self) -> str:
-        """Extract the raw path from entry text (strip prefix only)."""
+        """Return the path from the entry field.
+
+        Dropdown rows hold raw paths (pinned state is shown by color),
+        so no display-prefix stripping is needed.
+        """
         if _is_placeholder_active(self.entry):
             return ""
-        text = self.entry.get().strip()
-        if text.startswith(_PIN_PREFIX):
-            text = text[len(_PIN_PREFIX):]
-        elif text.startswith(_UNPIN_PREFIX):
-            text = text[len(_UNPIN_PREFIX):]
-        return text.strip()
+        return self.entry.get().strip()
 
     def _on_open(self) -> None:
         """Handle the Open button click."""
@@ -255,19 +394,20 @@ class HistorySection:
         if not path:
             return
         expanded = os.path.expanduser(path)
-        if is_unc_path(expanded) or Path(expanded).is_dir():
+        if is_unc_path(expanded) or is_dir_cached(expanded):
             log.info("Opening folder from history: %s", expanded)
             self.config.add_history(expanded)
-            self.config.save()
+            self.config.schedule_save()
             self.entry.delete(0, tk.END)
             self.entry.insert(0, expanded)
             self.on_open_folder(expanded)
         else:
             log.warning("Invalid path entered: %s", path)
+            from tkinter import messagebox
             messagebox.showwarning(
                 t("history.invalid_path_title"),
                 t("history.invalid_path_msg", path=path),
-                parent=self.frame.winfo_toplevel(),
+                parent=self._top,
             )
 
     def _on_pin(self) -> None:
@@ -277,25 +417,30 @@ class HistorySection:
             return
         expanded = os.path.expanduser(path)
         normalized = os.path.normpath(expanded)
-        found = False
-        for entry in self.config.data.history:
-            if os.path.normpath(entry.path) == normalized:
-                found = True
-                break
-        if not found:
+        # O(1) lookup against the config's normalized-path index instead
+        # of re-normalizing every history entry per click
+        if not self.config.has_history(normalized):
             self.config.add_history(expanded)
         self.config.toggle_pin(normalized)
-        self.config.save()
+        self.config.schedule_save()
         log.info("Pin toggled for: %s", normalized)
 
     def _on_clear(self) -> None:
-        """Handle the Clear button click."""
-        result = messagebox.askyesno(
-            t("history.clear_confirm_title"),
-            t("history.clear_confirm_msg"),
-            parent=self.frame.winfo_toplevel(),
-        )
-        if result:
-            log.info("User confirmed history clear")
-            self.config.clear_history(keep_pinned=True)
-            self.config.save()
+        """Toggle the inline clear confirmation row."""
+        if self._clear_confirm_visible:
+            self._hide_clear_confirm()
+            return
+        self._clear_confirm.pack(side=tk.LEFT, padx=(4, 0))
+        self._clear_confirm_visible = True
+
+    def _hide_clear_confirm(self) -> None:
+        """Dismiss the clear confirmation without clearing."""
+        self._clear_confirm.pack_forget()
+        self._clear_confirm_visible = False
+
+    def _on_clear_confirmed(self) -> None:
+        """Clear unpinned history after inline confirmation."""
+        self._hide_clear_confirm()
+        log.info("User confirmed history clear")
+        self.config.clear_history(keep_pinned=True)
+        self.config.schedule_save()
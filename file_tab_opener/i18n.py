@@ -7,11 +7,17 @@ translated strings via the `t()` function.
 
 from __future__ import annotations
 
-import locale
-import logging
+import sys
+from collections.abc import Callable
 from typing import Final
 
-log = logging.getLogger(__name__)
+
+def _log_event(level: str, msg: str, *args: object) -> None:
+    """Log lazily: the happy path never imports or touches logging."""
+    import logging
+
+    getattr(logging.getLogger(__name__), level)(msg, *args)
+
 
 # Supported language codes
 LANG_EN: Final[str] = "en"
@@ -93,6 +99,20 @@ _STRINGS: Final[dict[str, dict[str, str]]] = {
         LANG_ZH_TW: "是否刪除所有未釘選的歷史記錄？",
         LANG_ZH_CN: "是否删除所有未固定的历史记录？",
     },
+    "history.clear_yes": {
+        LANG_EN: "Yes",
+        LANG_JA: "はい",
+        LANG_KO: "예",
+        LANG_ZH_TW: "是",
+        LANG_ZH_CN: "是",
+    },
+    "history.clear_no": {
+        LANG_EN: "No",
+        LANG_JA: "いいえ",
+        LANG_KO: "아니요",
+        LANG_ZH_TW: "否",
+        LANG_ZH_CN: "否",
+    },
     "history.invalid_path_title": {
         LANG_EN: "Invalid Path",
         LANG_JA: "無効なパス",
@@ -286,20 +306,6 @@ _STRINGS: Final[dict[str, dict[str, str]]] = {
         LANG_ZH_TW: "輸入資料夾路徑...",
         LANG_ZH_CN: "输入文件夹路径...",
     },
-    "path.invalid_title": {
-        LANG_EN: "Invalid Path",
-        LANG_JA: "無効なパス",
-        LANG_KO: "잘못된 경로",
-        LANG_ZH_TW: "無效路徑",
-        LANG_ZH_CN: "无效路径",
-    },
-    "path.invalid_msg": {
-        LANG_EN: "Folder does not exist:\n{path}",
-        LANG_JA: "フォルダが存在しません:\n{path}",
-        LANG_KO: "폴더가 존재하지 않습니다:\n{path}",
-        LANG_ZH_TW: "資料夾不存在：\n{path}",
-        LANG_ZH_CN: "文件夹不存在：\n{path}",
-    },
 
     # --- Error messages ---
     "error.title": {
@@ -455,24 +461,89 @@ _STRINGS: Final[dict[str, dict[str, str]]] = {
     },
 }
 
-# Current language
+# Flat per-language tables derived from _STRINGS with the English
+# fallback already merged in, so t() is a single dict probe against
+# the active language instead of two nested lookups per call. Built
+# lazily: a process that only ever runs in one language flattens that
+# language (plus nothing else) instead of all five at import.
+_FLAT: dict[str, dict[str, str]] = {}
+
+# Pre-bound format_map methods for the values that contain format
+# fields. str.format reparses the template on every call; a bound
+# format_map is resolved once here and the kwargs path just invokes it.
+_FMT: dict[str, dict[str, Callable[[dict[str, str]], str]]] = {}
+
+# Alias keys whose text is identical to a canonical key's in every
+# language. Resolved while flattening so the aliases share the
+# canonical string objects instead of duplicating entries in _STRINGS.
+_ALIASES: Final[dict[str, str]] = {
+    "path.invalid_title": "history.invalid_path_title",
+    "path.invalid_msg": "history.invalid_path_msg",
+}
+
+
+class _SafeDict(dict):
+    """format_map mapping that leaves unknown fields as literal {name}."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def _flatten(lang: str) -> dict[str, str]:
+    """Build (on first use) and return the flat table for one language."""
+    table = _FLAT.get(lang)
+    if table is None:
+        # Interned keys let dict lookup hit its pointer-identity fast
+        # path; dotted keys are not identifier-shaped, so the compiler
+        # does not intern them on its own
+        intern = sys.intern
+        table = {
+            intern(key): entry.get(lang) or entry.get(LANG_EN, key)
+            for key, entry in _STRINGS.items()
+        }
+        for alias, canonical in _ALIASES.items():
+            table[intern(alias)] = table[canonical]
+        _FLAT[lang] = table
+        _FMT[lang] = {
+            key: text.format_map for key, text in table.items() if "{" in text
+        }
+    return table
+
+
+# Current language and the bound .get of its flat tables, swapped
+# together in set_language(). Hoisting the bound methods saves t() an
+# attribute load per call on top of the global load.
 _current_lang: str = LANG_EN
+_lookup: Callable[[str], str | None] = _flatten(LANG_EN).get
+_fmt_lookup: Callable[[str], Callable[[dict[str, str]], str] | None] = (
+    _FMT[LANG_EN].get
+)
+
+
+# Locale-prefix lookup for detection, probed longest prefix first:
+# zh_TW / zh_HK / zh_Hant -> Traditional, any other zh -> Simplified
+_LOCALE_PREFIXES: Final[dict[str, str]] = {
+    "ja": LANG_JA,
+    "ko": LANG_KO,
+    "zh_tw": LANG_ZH_TW,
+    "zh_hk": LANG_ZH_TW,
+    "zh_hant": LANG_ZH_TW,
+    "zh": LANG_ZH_CN,
+}
 
 
 def detect_system_language() -> str:
     """Detect the system language and return the best matching language code."""
+    # Deferred: importing locale walks the platform's locale machinery,
+    # and only this one-shot detection needs it
+    import locale
+
     try:
-        lang_code = locale.getlocale()[0] or ""
-        lang_code = lang_code.lower()
-        if lang_code.startswith("ja"):
-            return LANG_JA
-        if lang_code.startswith("ko"):
-            return LANG_KO
-        if lang_code.startswith("zh"):
-            # zh_TW, zh_HK, zh_Hant -> Traditional; otherwise -> Simplified
-            if any(tag in lang_code for tag in ("tw", "hk", "hant")):
-                return LANG_ZH_TW
-            return LANG_ZH_CN
+        lang_code = (locale.getlocale()[0] or "").lower()
+        for n in (7, 5, 2):
+            hit = _LOCALE_PREFIXES.get(lang_code[:n])
+            if hit:
+                return hit
     except Exception:
         pass
     return LANG_EN
@@ -480,13 +551,15 @@ def detect_system_language() -> str:
 
 def set_language(lang: str) -> None:
     """Set the current language."""
-    global _current_lang
+    global _current_lang, _lookup, _fmt_lookup
     if lang in SUPPORTED_LANGS:
         _current_lang = lang
-        log.info("Language set to: %s", lang)
+        _log_event("info", "Language set to: %s", lang)
     else:
-        log.warning("Unsupported language: %s, falling back to en", lang)
+        _log_event("warning", "Unsupported language: %s, falling back to en", lang)
         _current_lang = LANG_EN
+    _lookup = _flatten(_current_lang).get
+    _fmt_lookup = _FMT[_current_lang].get
 
 
 def get_language() -> str:
@@ -501,17 +574,19 @@ def t(key: str, **kwargs: str) -> str:
     Supports format placeholders: t("key", path="/foo") replaces {path}.
     Falls back to English if the key or language is missing.
     """
-    entry = _STRINGS.get(key)
-    if entry is None:
-        log.warning("Missing i18n key: %s", key)
+    text = _lookup(key)
+    if text is None:
+        # Compiled away under python -O; a missing key is a programming
+        # error worth flagging in development, not a production code path
+        if __debug__:
+            _log_event("warning", "Missing i18n key: %s", key)
         return key
-
-    text = entry.get(_current_lang) or entry.get(LANG_EN, key)
     if kwargs:
-        try:
-            text = text.format(**kwargs)
-        except KeyError:
-            pass
+        fn = _fmt_lookup(key)
+        if fn is not None:
+            # _SafeDict keeps missing fields literal, so no exception
+            # path is needed around the substitution
+            return fn(_SafeDict(kwargs))
     return text
 
 
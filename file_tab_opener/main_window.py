@@ -8,10 +8,10 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import threading
 import tkinter as tk
 import tkinter.ttk as ttk
-from tkinter import messagebox
 from typing import Any
 
 from file_tab_opener.config import ConfigManager
@@ -28,6 +28,10 @@ log = logging.getLogger(__name__)
 if CTK_AVAILABLE:
     import customtkinter as ctk
 
+# Combobox contents are constant; build them once at import
+TIMEOUT_VALUES = ("5", "10", "15", "30", "60")
+LANG_DISPLAY_VALUES = tuple(LANG_NAMES[code] for code in SUPPORTED_LANGS)
+
 
 class MainWindow:
     """Application main window."""
@@ -37,6 +41,12 @@ class MainWindow:
         self.opener = opener
         self.root = get_root(t("app.title"))
         self._content_frame: tk.Frame | None = None
+        # Lazily started daemon worker fed by a queue (same pattern as
+        # ConfigManager's save worker). A daemon thread means closing the
+        # window never blocks process exit on an in-flight open, which can
+        # hang for seconds on a dead network mount; opens are serialized
+        # by the _opening flag so one worker is enough
+        self._open_queue: queue.SimpleQueue | None = None
 
     def build(self) -> None:
         """Build the GUI layout."""
@@ -79,11 +89,16 @@ class MainWindow:
             settings_inner = ttk.Frame(settings_bar)
         settings_inner.pack(side=tk.RIGHT)
 
+        # (widget, i18n key) pairs updated in place on language change
+        self._i18n_widgets: list[tuple[Any, str]] = []
+
         # Timeout selector
-        Label(settings_inner, text=t("settings.timeout")).pack(side=tk.LEFT, padx=(0, 3))
+        timeout_label = Label(settings_inner, text=t("settings.timeout"))
+        timeout_label.pack(side=tk.LEFT, padx=(0, 3))
+        self._i18n_widgets.append((timeout_label, "settings.timeout"))
         self._timeout_combo = ttk.Combobox(
             settings_inner,
-            values=["5", "10", "15", "30", "60"],
+            values=TIMEOUT_VALUES,
             state="readonly",
             width=3,
         )
@@ -91,15 +106,15 @@ class MainWindow:
         self._timeout_combo.set(str(saved_timeout))
         self._timeout_combo.pack(side=tk.LEFT)
         self._timeout_combo.bind("<<ComboboxSelected>>", self._on_timeout_changed)
-        Label(settings_inner, text=t("settings.timeout_unit")).pack(
-            side=tk.LEFT, padx=(1, 10)
-        )
+        unit_label = Label(settings_inner, text=t("settings.timeout_unit"))
+        unit_label.pack(side=tk.LEFT, padx=(1, 10))
+        self._i18n_widgets.append((unit_label, "settings.timeout_unit"))
 
         # Language selector
         Label(settings_inner, text="🌐").pack(side=tk.LEFT, padx=(0, 3))
         self._lang_combo = ttk.Combobox(
             settings_inner,
-            values=[LANG_NAMES[code] for code in SUPPORTED_LANGS],
+            values=LANG_DISPLAY_VALUES,
             state="readonly",
             width=10,
         )
@@ -160,7 +175,7 @@ class MainWindow:
         except ValueError:
             return
         self.config.data.settings["timeout"] = value
-        self.config.save()
+        self.config.schedule_save()
         log.info("Timeout changed to %d seconds", value)
 
     def _on_language_changed(self, event: Any) -> None:
@@ -173,10 +188,23 @@ class MainWindow:
             old_lang = i18n.get_language()
             i18n.set_language(code)
             self.config.data.settings["language"] = code
-            self.config.save()
+            self.config.schedule_save()
             log.info("Language changed: %s -> %s", old_lang, code)
             self.root.title(t("app.title"))
-            self._build_content()
+            self._retranslate()
+
+    def _retranslate(self) -> None:
+        """Re-apply translated texts in place after a language change.
+
+        Walks the (widget, key) registries instead of destroying and
+        rebuilding the whole content frame, so widget state (current
+        tab, listbox contents, entries) survives and there is no
+        flicker from O(widgets) teardown/reconstruction.
+        """
+        for widget, key in self._i18n_widgets:
+            widget.configure(text=t(key))
+        self.history_section.retranslate()
+        self.tab_group_section.retranslate()
 
     def _get_timeout(self) -> float:
         """Get the current timeout setting in seconds."""
@@ -195,25 +223,11 @@ class MainWindow:
         self, paths: list[str], window_rect: tuple[int, int, int, int] | None = None,
     ) -> None:
         """Open multiple folders as tabs (runs in a worker thread)."""
-        log.info("Opening folders as tabs: %d paths", len(paths))
-        valid, invalid = self.opener.validate_paths(paths)
-        if invalid:
-            log.warning("Invalid paths: %s", invalid)
-            messagebox.showwarning(
-                t("error.invalid_paths_title"),
-                t("error.invalid_paths_msg", paths="\n".join(invalid)),
-                parent=self.root,
-            )
-        if not valid:
-            log.warning("No valid paths to open")
-            return
+        from tkinter import messagebox
 
+        log.info("Opening folders as tabs: %d paths", len(paths))
         timeout = self._get_timeout()
 
-        # Show wait cursor and toast while tabs are being opened
-        self._set_cursor("wait")
-        self._show_toast(len(valid), valid[0])
-
         def safe_after(callback: Any) -> None:
             """Schedule callback on main thread, ignoring TclError if window closed."""
             try:
@@ -223,6 +237,24 @@ class MainWindow:
 
         def do_open() -> None:
             try:
+                # Validate on the worker: a stat on a dead mount can block
+                # for seconds and must not freeze the UI
+                valid, invalid = self.opener.validate_paths(paths)
+                if invalid:
+                    log.warning("Invalid paths: %s", invalid)
+                    safe_after(
+                        lambda: messagebox.showwarning(
+                            t("error.invalid_paths_title"),
+                            t("error.invalid_paths_msg", paths="\n".join(invalid)),
+                            parent=self.root,
+                        ),
+                    )
+                if not valid:
+                    log.warning("No valid paths to open")
+                    return
+                safe_after(
+                    lambda: self._begin_open_feedback(len(valid), valid[0]),
+                )
                 self.opener.open_folders_as_tabs(
                     valid,
                     on_progress=lambda cur, tot, p: safe_after(
@@ -250,7 +282,28 @@ class MainWindow:
             finally:
                 safe_after(self._reset_tab_opening_flag)
 
-        threading.Thread(target=do_open, daemon=True).start()
+        if self._open_queue is None:
+            self._open_queue = queue.SimpleQueue()
+            threading.Thread(
+                target=self._open_worker, name="tab-opener", daemon=True
+            ).start()
+        self._open_queue.put(do_open)
+
+    def _open_worker(self) -> None:
+        """Worker-thread loop: run queued open jobs one at a time."""
+        q = self._open_queue
+        assert q is not None
+        while True:
+            job = q.get()
+            try:
+                job()
+            except Exception as e:
+                log.error("Open worker job failed: %s", e, exc_info=True)
+
+    def _begin_open_feedback(self, total: int, first_path: str) -> None:
+        """Show wait cursor and toast once validation has passed."""
+        self._set_cursor("wait")
+        self._show_toast(total, first_path)
 
     def _set_cursor(self, cursor: str) -> None:
         """Set cursor on root and all descendant widgets recursively."""
@@ -290,6 +343,8 @@ class MainWindow:
             relwidth=0.5, relheight=0.5,
         )
 
+        # Invariant while the toast lives; resolved once instead of per tick
+        self._toast_footer = t("toast.wait_message")
         text = self._build_toast_text(1, total, first_path)
         label = tk.Label(
             toast,
@@ -338,7 +393,7 @@ class MainWindow:
     def _build_toast_text(self, current: int, total: int, path: str) -> str:
         """Build the 4-line toast text."""
         header = t("toast.progress_header", current=current, total=total)
-        footer = t("toast.wait_message")
+        footer = getattr(self, "_toast_footer", None) or t("toast.wait_message")
         path_line = self._compact_path(path) if path else ""
         return f"{header}\n{path_line}\n{footer}"
 
@@ -362,6 +417,8 @@ class MainWindow:
 
     def _on_close(self) -> None:
         """Save window geometry and close."""
+        if hasattr(self, "tab_group_section"):
+            self.tab_group_section.flush_pending_saves()
         geom = self.root.geometry()
         self.config.data.window_geometry = geom
         self.config.save()
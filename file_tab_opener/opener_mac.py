@@ -221,7 +221,50 @@ def _open_separate(
     on_error: Callable[[str, str], None] | None = None,
     window_rect: tuple[int, int, int, int] | None = None,
 ) -> bool:
-    """Fallback: open each folder in a separate new window."""
+    """Fallback: open each folder in a separate new window.
+
+    All windows are opened by a single combined osascript invocation
+    (one subprocess instead of N, with the 0.3s Finder pacing moved
+    into the script as AppleScript delays). Per-path subprocess spawns
+    remain only as a second-level fallback, and only when the batch
+    cannot have executed at all (osascript missing): AppleScript runs
+    statement-by-statement, so a timeout or mid-script error means an
+    unknown prefix of the windows already opened and replaying the
+    list would duplicate them.
+
+    Note: on the batch path the progress callback degrades to
+    start/end — per-path progress exists only in the fallback loop.
+    """
+    combined = "\n".join(
+        _build_open_window_script(p, window_rect)
+        + ("\ndelay 0.3" if i < len(paths) else "")
+        for i, p in enumerate(paths, start=1)
+    )
+    try:
+        subprocess.run(
+            ["osascript", "-e", combined],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=_APPLESCRIPT_TIMEOUT + 0.3 * len(paths),
+            check=True,
+        )
+        if on_progress:
+            for i, p in enumerate(paths, start=1):
+                on_progress(i, len(paths), p)
+        return True
+    except FileNotFoundError as e:
+        # osascript itself is missing: no window can have opened, so
+        # the per-path fallback below is safe
+        log.warning("Batched window open failed, retrying per path: %s", e)
+    except Exception as e:
+        # Timeout or mid-script error: some windows likely opened
+        # already, so replaying the list would duplicate them. Report
+        # and stop, mirroring the single-failure path in
+        # open_folders_as_tabs.
+        log.error("Batched window open failed partway: %s", e)
+        if on_error:
+            on_error(paths[0], str(e))
+        return True
+
     for i, path in enumerate(paths, start=1):
         try:
             script = _build_open_window_script(path, window_rect)
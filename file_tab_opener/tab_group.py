@@ -8,14 +8,11 @@ from __future__ import annotations
 
 import logging
 import os
-import subprocess
 import tkinter as tk
 import tkinter.ttk as ttk
 from collections.abc import Callable
-from pathlib import Path
 
-from file_tab_opener import is_unc_path
-from tkinter import filedialog, messagebox, simpledialog
+from file_tab_opener import is_dir_cached, is_unc_path
 from typing import Any
 
 from file_tab_opener.config import ConfigManager
@@ -31,9 +28,13 @@ from file_tab_opener.widgets import (
     Label,
     Entry,
     TabView,
+    Debouncer,
     _strip_quotes,
     _setup_placeholder,
     _is_placeholder_active,
+    _listbox_colors,
+    _select_all_on_focus,
+    _update_placeholder,
 )
 
 log = logging.getLogger(__name__)
@@ -46,6 +47,37 @@ if CTK_AVAILABLE:
 MIN_WINDOW_WIDTH = 528
 MIN_WINDOW_HEIGHT = 308
 
+# Cached ScriptingBridge proxy for Finder (macOS, PyObjC optional)
+_finder_app: Any = None
+
+
+def _get_finder_bounds_native() -> tuple[int, int, int, int] | None:
+    """Query the front Finder window bounds in-process via ScriptingBridge.
+
+    Avoids forking osascript (process spawn + AppleScript compile) on
+    every click. Returns None when PyObjC is unavailable or no Finder
+    window exists; callers then fall back to osascript.
+    """
+    global _finder_app
+    try:
+        if _finder_app is None:
+            from ScriptingBridge import SBApplication
+
+            _finder_app = SBApplication.applicationWithBundleIdentifier_(
+                "com.apple.finder"
+            )
+        windows = _finder_app.FinderWindows()
+        if not windows:
+            return None
+        b = windows[0].bounds()
+        return (
+            int(b.origin.x), int(b.origin.y),
+            int(b.size.width), int(b.size.height),
+        )
+    except Exception as e:
+        log.debug("ScriptingBridge Finder query failed: %s", e)
+        return None
+
 
 class TabGroupSection:
     """Bottom section: tab bar + path list + action buttons + Open as Tabs button."""
@@ -62,32 +94,56 @@ class TabGroupSection:
         self._opening: bool = False
 
         self.frame = Frame(parent)
+        # The section is never reparented, so the toplevel is fixed
+        self._top = self.frame.winfo_toplevel()
+        # Coalesces the burst of FocusOut/Return events from the four
+        # geometry entries into a single config save
+        self._geom_saver = Debouncer(self.frame, 250, self._save_geometry)
+        # Coalesces rapid move clicks (held button / keyboard repeat)
+        # into one serialization after the burst ends
+        self._move_saver = Debouncer(self.frame, 300, self.config.schedule_save)
         self._build_widgets()
-        self._load_tabs_from_config()
+        # Populate tabs after first paint: the window appears immediately
+        # and the per-group tab buttons are built on the first idle pass
+        self.frame.after_idle(self._load_tabs_from_config)
+
+    def _register(self, widget: Any, key: str) -> Any:
+        """Track a widget whose text is re-applied by retranslate()."""
+        self._i18n_widgets.append((widget, key))
+        return widget
 
     def _build_widgets(self) -> None:
         """Build all widgets in the tab group section."""
+        # (widget, i18n key) pairs updated in place on language change
+        self._i18n_widgets: list[tuple[Any, str]] = []
+
         # --- Tab management bar ---
         tab_bar = Frame(self.frame)
         tab_bar.pack(fill=tk.X, pady=(0, 5))
 
-        Button(tab_bar, text=t("tab.add"), command=self._on_add_tab, width=10).pack(
-            side=tk.LEFT, padx=2
-        )
-        Button(
-            tab_bar, text=t("tab.delete"), command=self._on_delete_tab, width=10
+        self._register(
+            Button(tab_bar, text=t("tab.add"), command=self._on_add_tab, width=10),
+            "tab.add",
         ).pack(side=tk.LEFT, padx=2)
-        Button(
-            tab_bar, text=t("tab.rename"), command=self._on_rename_tab, width=10
+        self._register(
+            Button(tab_bar, text=t("tab.delete"), command=self._on_delete_tab, width=10),
+            "tab.delete",
         ).pack(side=tk.LEFT, padx=2)
-        Button(
-            tab_bar, text=t("tab.copy"), command=self._on_copy_tab, width=10
+        self._register(
+            Button(tab_bar, text=t("tab.rename"), command=self._on_rename_tab, width=10),
+            "tab.rename",
         ).pack(side=tk.LEFT, padx=2)
-        Button(
-            tab_bar, text=t("tab.move_left"), command=self._on_move_tab_left, width=3
+        self._register(
+            Button(tab_bar, text=t("tab.copy"), command=self._on_copy_tab, width=10),
+            "tab.copy",
+        ).pack(side=tk.LEFT, padx=2)
+        self._register(
+            Button(tab_bar, text=t("tab.move_left"), command=self._on_move_tab_left, width=3),
+            "tab.move_left",
         ).pack(side=tk.LEFT, padx=(10, 0))
-        Button(
-            tab_bar, text=t("tab.move_right"), command=self._on_move_tab_right, width=3
+        self._register(
+            Button(tab_bar, text=t("tab.move_right"), command=self._on_move_tab_right, width=3),
+            "tab.move_right",
         ).pack(side=tk.LEFT, padx=2)
 
         # --- Tab view (tab names only, no expand) ---
@@ -100,37 +156,52 @@ class TabGroupSection:
 
         geom_entry_width = 70 if CTK_AVAILABLE else 7
 
-        Label(geom_frame, text=t("window.x")).pack(side=tk.LEFT, padx=(0, 2))
+        self._register(
+            Label(geom_frame, text=t("window.x")), "window.x"
+        ).pack(side=tk.LEFT, padx=(0, 2))
         self._geom_x_entry = Entry(geom_frame, width=geom_entry_width)
         self._geom_x_entry.pack(side=tk.LEFT, padx=(0, 8))
 
-        Label(geom_frame, text=t("window.y")).pack(side=tk.LEFT, padx=(0, 2))
+        self._register(
+            Label(geom_frame, text=t("window.y")), "window.y"
+        ).pack(side=tk.LEFT, padx=(0, 2))
         self._geom_y_entry = Entry(geom_frame, width=geom_entry_width)
         self._geom_y_entry.pack(side=tk.LEFT, padx=(0, 8))
 
-        Label(geom_frame, text=t("window.width")).pack(side=tk.LEFT, padx=(0, 2))
+        self._register(
+            Label(geom_frame, text=t("window.width")), "window.width"
+        ).pack(side=tk.LEFT, padx=(0, 2))
         self._geom_w_entry = Entry(geom_frame, width=geom_entry_width)
         self._geom_w_entry.pack(side=tk.LEFT, padx=(0, 8))
 
-        Label(geom_frame, text=t("window.height")).pack(side=tk.LEFT, padx=(0, 2))
+        self._register(
+            Label(geom_frame, text=t("window.height")), "window.height"
+        ).pack(side=tk.LEFT, padx=(0, 2))
         self._geom_h_entry = Entry(geom_frame, width=geom_entry_width)
         self._geom_h_entry.pack(side=tk.LEFT, padx=(0, 8))
 
         if IS_MAC:
-            Button(
-                geom_frame, text=t("window.get_from_finder"),
-                command=self._on_get_finder_bounds, width=14,
+            self._register(
+                Button(
+                    geom_frame, text=t("window.get_from_finder"),
+                    command=self._on_get_finder_bounds, width=14,
+                ),
+                "window.get_from_finder",
             ).pack(side=tk.LEFT)
         elif IS_WIN:
-            Button(
-                geom_frame, text=t("window.get_from_explorer"),
-                command=self._on_get_explorer_bounds, width=18,
+            self._register(
+                Button(
+                    geom_frame, text=t("window.get_from_explorer"),
+                    command=self._on_get_explorer_bounds, width=18,
+                ),
+                "window.get_from_explorer",
             ).pack(side=tk.LEFT)
 
+        # One bound method shared by all eight bindings, no per-entry lambdas
         for entry in (self._geom_x_entry, self._geom_y_entry,
                        self._geom_w_entry, self._geom_h_entry):
-            entry.bind("<FocusOut>", lambda e: self._save_geometry())
-            entry.bind("<Return>", lambda e: self._save_geometry())
+            entry.bind("<FocusOut>", self._on_geom_entry_event)
+            entry.bind("<Return>", self._on_geom_entry_event)
 
         # --- Content area (listbox + buttons) ---
         content = Frame(self.frame)
@@ -143,7 +214,15 @@ class TabGroupSection:
             list_frame = ttk.Frame(content)
         list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        self.listbox = tk.Listbox(list_frame, selectmode=tk.SINGLE, height=10)
+        # Colors go in the constructor: one Tcl command, no follow-up configure
+        if CTK_AVAILABLE:
+            bg, fg, sel = _listbox_colors()
+            self.listbox = tk.Listbox(
+                list_frame, selectmode=tk.SINGLE, height=10,
+                bg=bg, fg=fg, selectbackground=sel,
+            )
+        else:
+            self.listbox = tk.Listbox(list_frame, selectmode=tk.SINGLE, height=10)
         scrollbar_y = ttk.Scrollbar(
             list_frame, orient=tk.VERTICAL, command=self.listbox.yview
         )
@@ -158,64 +237,64 @@ class TabGroupSection:
         self.listbox.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Mirror of the listbox contents, used to diff refreshes
+        self._listbox_contents: list[str] = []
+
         # Copy selected path to entry field
         self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
 
-        # Adjust listbox theme when using customtkinter
-        if CTK_AVAILABLE:
-            try:
-                mode = ctk.get_appearance_mode()
-                if mode == "Dark":
-                    self.listbox.configure(
-                        bg="#2b2b2b", fg="#ffffff", selectbackground="#1f6aa5"
-                    )
-                else:
-                    self.listbox.configure(
-                        bg="#ffffff", fg="#000000", selectbackground="#1f6aa5"
-                    )
-            except Exception as e:
-                log.debug("Theme detection failed for listbox: %s", e)
-
         # Action buttons (right side)
         btn_frame = Frame(content)
         btn_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(5, 0))
 
-        for text, cmd in [
-            (t("path.move_up"), self._on_move_up),
-            (t("path.move_down"), self._on_move_down),
-            (t("path.add"), self._on_add_path),
-            (t("path.remove"), self._on_remove_path),
-            (t("path.browse"), self._on_browse),
+        for key, cmd in [
+            ("path.move_up", self._on_move_up),
+            ("path.move_down", self._on_move_down),
+            ("path.add", self._on_add_path),
+            ("path.remove", self._on_remove_path),
+            ("path.browse", self._on_browse),
         ]:
-            Button(btn_frame, text=text, command=cmd, width=10).pack(
-                pady=2, fill=tk.X
-            )
+            self._register(
+                Button(btn_frame, text=t(key), command=cmd, width=10), key
+            ).pack(pady=2, fill=tk.X)
 
         # --- Path entry ---
         entry_frame = Frame(self.frame)
         entry_frame.pack(fill=tk.X, pady=(0, 5))
 
+        # Resolve the placeholder once; focus handlers close over it and
+        # never re-query the i18n table per event
+        self._placeholder = t("path.placeholder")
         if CTK_AVAILABLE:
-            self.path_entry = Entry(entry_frame, placeholder_text=t("path.placeholder"))
+            self.path_entry = Entry(entry_frame, placeholder_text=self._placeholder)
         else:
             self.path_entry = Entry(entry_frame)
-            _setup_placeholder(self.path_entry, t("path.placeholder"))
+            _setup_placeholder(self.path_entry, self._placeholder)
             # macOS: select all on focus (ttk only; CTkEntry handles this internally)
             if IS_MAC:
-                self.path_entry.bind(
-                    "<FocusIn>", lambda e: e.widget.selection_range(0, tk.END), add="+",
-                )
+                self.path_entry.bind("<FocusIn>", _select_all_on_focus, add="+")
         self.path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
 
         # Enter key to add path
-        self.path_entry.bind("<Return>", lambda e: self._on_add_path())
+        self.path_entry.bind("<Return>", self._on_add_path)
 
         # --- Open as Tabs button ---
-        self.open_btn = Button(
-            self.frame, text=t("tab.open_as_tabs"), command=self._on_open_as_tabs
+        self.open_btn = self._register(
+            Button(self.frame, text=t("tab.open_as_tabs"), command=self._on_open_as_tabs),
+            "tab.open_as_tabs",
         )
         self.open_btn.pack(fill=tk.X, pady=(5, 0), ipady=8)
 
+    def retranslate(self) -> None:
+        """Re-apply translated widget texts in place after a language change."""
+        for widget, key in self._i18n_widgets:
+            widget.configure(text=t(key))
+        self._placeholder = t("path.placeholder")
+        if CTK_AVAILABLE:
+            self.path_entry.configure(placeholder_text=self._placeholder)
+        else:
+            _update_placeholder(self.path_entry, self._placeholder)
+
     def _load_tabs_from_config(self) -> None:
         """Restore tab groups from the config file. Create a default tab if empty."""
         if not self.config.data.tab_groups:
@@ -237,24 +316,49 @@ class TabGroupSection:
 
     def _on_tab_changed(self, tab_name: str) -> None:
         """Handle tab selection change."""
-        self._save_geometry()
+        if tab_name == self.current_tab_name:
+            return
+        # Flush (not debounce) here: a deferred save would run after
+        # current_tab_name changes and write into the wrong group
+        self._geom_saver.flush()
         self.current_tab_name = tab_name
         self.restore_tab_state()
 
     def _refresh_listbox(self) -> None:
-        """Update the listbox with paths from the current tab group."""
-        self.listbox.delete(0, tk.END)
-        if not self.current_tab_name:
-            return
-        group = self.config.get_tab_group(self.current_tab_name)
-        if group:
-            for path in group.paths:
-                self.listbox.insert(tk.END, path)
+        """Update the listbox with paths from the current tab group.
+
+        Applies only the differing middle slice against what the widget
+        already holds instead of delete-all + reinsert, so rows shared
+        between the old and new contents are left untouched.
+        """
+        new: list[str] = []
+        if self.current_tab_name:
+            group = self.config.get_tab_group(self.current_tab_name)
+            if group:
+                new = list(group.paths)
+        old = self._listbox_contents
+        if new != old:
+            # Common prefix/suffix lengths bound the slice to replace
+            limit = min(len(old), len(new))
+            p = 0
+            while p < limit and old[p] == new[p]:
+                p += 1
+            s = 0
+            while s < limit - p and old[-1 - s] == new[-1 - s]:
+                s += 1
+            if len(old) - s > p:
+                self.listbox.delete(p, len(old) - s - 1)
+            mid = new[p:len(new) - s]
+            if mid:
+                # Single variadic insert: one Tcl command instead of one per row
+                self.listbox.insert(p, *mid)
+            self._listbox_contents = new
         self.listbox.xview_moveto(0)
 
     def _on_add_tab(self) -> None:
         """Handle the Add Tab button click."""
-        top = self.frame.winfo_toplevel()
+        from tkinter import messagebox, simpledialog
+        top = self._top
         name = simpledialog.askstring(
             t("tab.add_dialog_title"), t("tab.add_dialog_prompt"), parent=top
         )
@@ -269,7 +373,7 @@ class TabGroupSection:
             )
             return
         self.config.add_tab_group(name)
-        self.config.save()
+        self.config.schedule_save()
         self.tab_view.add_tab(name)
         self.tab_view.set_current_tab(name)
         self.current_tab_name = name
@@ -278,10 +382,11 @@ class TabGroupSection:
 
     def _on_delete_tab(self) -> None:
         """Handle the Delete Tab button click."""
+        from tkinter import messagebox
         name = self.tab_view.get_current_tab_name()
         if not name:
             return
-        top = self.frame.winfo_toplevel()
+        top = self._top
         result = messagebox.askyesno(
             t("tab.delete_confirm_title"),
             t("tab.delete_confirm_msg", name=name),
@@ -290,7 +395,7 @@ class TabGroupSection:
         if result:
             log.info("Tab deleted: %s", name)
             self.config.delete_tab_group(name)
-            self.config.save()
+            self.config.schedule_save()
             self.tab_view.delete_tab(name)
             # delete_tab selects the right neighbor (or left if rightmost)
             new_current = self.tab_view.get_current_tab_name()
@@ -302,10 +407,11 @@ class TabGroupSection:
 
     def _on_rename_tab(self) -> None:
         """Handle the Rename Tab button click."""
+        from tkinter import messagebox, simpledialog
         old_name = self.tab_view.get_current_tab_name()
         if not old_name:
             return
-        top = self.frame.winfo_toplevel()
+        top = self._top
         new_name = simpledialog.askstring(
             t("tab.rename_dialog_title"),
             t("tab.rename_dialog_prompt"),
@@ -323,7 +429,7 @@ class TabGroupSection:
             )
             return
         self.config.rename_tab_group(old_name, new_name)
-        self.config.save()
+        self.config.schedule_save()
         self.tab_view.rename_tab(old_name, new_name)
         self.current_tab_name = new_name
         log.info("Tab renamed: %s -> %s", old_name, new_name)
@@ -336,7 +442,7 @@ class TabGroupSection:
         new_group = self.config.copy_tab_group(name)
         if not new_group:
             return
-        self.config.save()
+        self.config.schedule_save()
         self.tab_view.add_tab(new_group.name)
         self.tab_view.set_current_tab(new_group.name)
         self.current_tab_name = new_group.name
@@ -354,7 +460,7 @@ class TabGroupSection:
         if idx <= 0:
             return
         self.config.move_tab_group(idx, idx - 1)
-        self.config.save()
+        self._move_saver.schedule()
         self.tab_view.move_tab(idx, idx - 1)
 
     def _on_move_tab_right(self) -> None:
@@ -367,25 +473,30 @@ class TabGroupSection:
         if idx >= len(names) - 1:
             return
         self.config.move_tab_group(idx, idx + 1)
-        self.config.save()
+        self._move_saver.schedule()
         self.tab_view.move_tab(idx, idx + 1)
 
-    def _on_add_path(self) -> None:
+    def _on_geom_entry_event(self, _event: Any) -> None:
+        """FocusOut/Return on a geometry entry: schedule a debounced save."""
+        self._geom_saver.schedule()
+
+    def _on_add_path(self, _event: Any = None) -> None:
         """Handle the Add Path button click or Enter key in path entry."""
+        from tkinter import messagebox
         if _is_placeholder_active(self.path_entry):
             return
         raw = self.path_entry.get().strip()
         path = _strip_quotes(raw)
         if not path:
             return
-        top = self.frame.winfo_toplevel()
+        top = self._top
         if not self.current_tab_name:
             messagebox.showinfo(
                 t("tab.no_tab_title"), t("tab.no_tab_msg"), parent=top
             )
             return
         expanded = os.path.expanduser(path)
-        if not (is_unc_path(expanded) or Path(expanded).is_dir()):
+        if not (is_unc_path(expanded) or is_dir_cached(expanded)):
             messagebox.showwarning(
                 t("path.invalid_title"),
                 t("path.invalid_msg", path=path),
@@ -393,7 +504,7 @@ class TabGroupSection:
             )
             return
         self.config.add_path_to_group(self.current_tab_name, expanded)
-        self.config.save()
+        self.config.schedule_save()
         self._refresh_listbox()
         self.path_entry.delete(0, tk.END)
         log.info("Path added to '%s': %s", self.current_tab_name, expanded)
@@ -405,7 +516,7 @@ class TabGroupSection:
             return
         removed_path = self.listbox.get(sel[0])
         self.config.remove_path_from_group(self.current_tab_name, sel[0])
-        self.config.save()
+        self.config.schedule_save()
         self._refresh_listbox()
         log.info("Path removed from '%s': %s", self.current_tab_name, removed_path)
 
@@ -416,7 +527,7 @@ class TabGroupSection:
             return
         idx = sel[0]
         self.config.move_path_in_group(self.current_tab_name, idx, idx - 1)
-        self.config.save()
+        self._move_saver.schedule()
         self._refresh_listbox()
         self.listbox.selection_set(idx - 1)
         log.debug("Path moved up: [%d] -> [%d] in '%s'", idx, idx - 1, self.current_tab_name)
@@ -430,14 +541,15 @@ class TabGroupSection:
         group = self.config.get_tab_group(self.current_tab_name)
         if group and idx < len(group.paths) - 1:
             self.config.move_path_in_group(self.current_tab_name, idx, idx + 1)
-            self.config.save()
+            self._move_saver.schedule()
             self._refresh_listbox()
             self.listbox.selection_set(idx + 1)
             log.debug("Path moved down: [%d] -> [%d] in '%s'", idx, idx + 1, self.current_tab_name)
 
     def _on_browse(self) -> None:
         """Open a folder selection dialog."""
-        top = self.frame.winfo_toplevel()
+        from tkinter import filedialog
+        top = self._top
         path = filedialog.askdirectory(parent=top)
         if path:
             normalized = os.path.normpath(path)
@@ -453,8 +565,10 @@ class TabGroupSection:
         self.path_entry.delete(0, tk.END)
         self.path_entry.insert(0, path)
 
-    def _on_get_finder_bounds(self) -> None:
-        """Get the frontmost Finder window's bounds and fill geometry fields."""
+    @staticmethod
+    def _get_finder_bounds_osascript() -> tuple[int, int, int, int] | None:
+        """Fallback: get the front Finder window bounds via osascript."""
+        import subprocess
         try:
             result = subprocess.run(
                 ["osascript", "-e",
@@ -462,23 +576,28 @@ class TabGroupSection:
                 capture_output=True, text=True, timeout=5,
             )
             if result.returncode != 0:
-                messagebox.showinfo(
-                    t("window.no_finder_title"),
-                    t("window.no_finder_msg"),
-                    parent=self.frame.winfo_toplevel(),
-                )
-                return
+                return None
             parts = [int(s.strip()) for s in result.stdout.strip().split(",")]
             x, y, x2, y2 = parts[0], parts[1], parts[2], parts[3]
-            w, h = x2 - x, y2 - y
+            return (x, y, x2 - x, y2 - y)
         except Exception as e:
             log.warning("Failed to get Finder bounds: %s", e)
+            return None
+
+    def _on_get_finder_bounds(self) -> None:
+        """Get the frontmost Finder window's bounds and fill geometry fields."""
+        bounds = _get_finder_bounds_native()
+        if bounds is None:
+            bounds = self._get_finder_bounds_osascript()
+        if bounds is None:
+            from tkinter import messagebox
             messagebox.showinfo(
                 t("window.no_finder_title"),
                 t("window.no_finder_msg"),
-                parent=self.frame.winfo_toplevel(),
+                parent=self._top,
             )
             return
+        x, y, w, h = bounds
 
         for entry, val in [
             (self._geom_x_entry, x), (self._geom_y_entry, y),
@@ -490,6 +609,7 @@ class TabGroupSection:
 
     def _on_get_explorer_bounds(self) -> None:
         """Get the frontmost Explorer window's bounds and fill geometry fields."""
+        from tkinter import messagebox
         try:
             from file_tab_opener.opener_win import get_frontmost_explorer_rect
 
@@ -498,7 +618,7 @@ class TabGroupSection:
                 messagebox.showinfo(
                     t("window.no_explorer_title"),
                     t("window.no_explorer_msg"),
-                    parent=self.frame.winfo_toplevel(),
+                    parent=self._top,
                 )
                 return
             x, y, w, h = rect
@@ -507,7 +627,7 @@ class TabGroupSection:
             messagebox.showinfo(
                 t("window.no_explorer_title"),
                 t("window.no_explorer_msg"),
-                parent=self.frame.winfo_toplevel(),
+                parent=self._top,
             )
             return
 
@@ -559,7 +679,7 @@ class TabGroupSection:
         # Update entry fields to show clamped values
         self._update_entry(self._geom_w_entry, group.window_width)
         self._update_entry(self._geom_h_entry, group.window_height)
-        self.config.save()
+        self.config.schedule_save()
 
     @staticmethod
     def _parse_int(value: str) -> int | None:
@@ -588,7 +708,7 @@ class TabGroupSection:
 
     def _get_window_rect(self) -> tuple[int, int, int, int] | None:
         """Return the window rect for the current tab group, or None if incomplete."""
-        self._save_geometry()
+        self._geom_saver.flush()
         if not self.current_tab_name:
             return None
         group = self.config.get_tab_group(self.current_tab_name)
@@ -601,9 +721,10 @@ class TabGroupSection:
 
     def _on_open_as_tabs(self) -> None:
         """Handle the Open as Tabs button click."""
+        from tkinter import messagebox
         if self._opening:
             return
-        top = self.frame.winfo_toplevel()
+        top = self._top
         if not self.current_tab_name:
             messagebox.showinfo(
                 t("tab.no_tab_title"), t("tab.no_tab_msg"), parent=top
@@ -622,3 +743,13 @@ class TabGroupSection:
     def reset_opening(self) -> None:
         """Reset the opening flag. Called by MainWindow when the worker thread completes."""
         self._opening = False
+
+    def flush_pending_saves(self) -> None:
+        """Apply any debounced saves immediately.
+
+        Called by MainWindow on close: destroying the root would drop
+        the pending after() callbacks, losing a geometry edit made
+        within the debounce window.
+        """
+        self._geom_saver.flush()
+        self._move_saver.flush()
@@ -7,14 +7,17 @@ customtkinter (modern UI) or fall back to standard tkinter/ttk.
 
 from __future__ import annotations
 
+import functools
 import logging
 import platform
 import tkinter as tk
 import tkinter.ttk as ttk
 import unicodedata
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
+from file_tab_opener.config import strip_quotes
+
 log = logging.getLogger(__name__)
 
 __all__ = [
@@ -55,16 +58,65 @@ def is_dark_mode() -> bool:
         return False
 
 
+class Debouncer:
+    """Coalesce rapid calls into one deferred invocation via Tk's after().
+
+    For event bursts where only the final state matters (focus chains,
+    repeated clicks, future per-keystroke filtering): schedule() resets
+    the timer, flush() cancels any pending timer and fires immediately.
+    """
+
+    def __init__(self, widget: Any, delay_ms: int, fn: Callable[[], None]) -> None:
+        self._widget = widget
+        self._delay_ms = delay_ms
+        self._fn = fn
+        self._after_id: str | None = None
+
+    def schedule(self) -> None:
+        """(Re)start the timer; fn runs once the burst goes quiet."""
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+        self._after_id = self._widget.after(self._delay_ms, self._fire)
+
+    def flush(self) -> None:
+        """Cancel any pending timer and invoke fn synchronously."""
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._fn()
+
+    def _fire(self) -> None:
+        self._after_id = None
+        self._fn()
+
+
+def _listbox_colors() -> tuple[str, str, str]:
+    """Return (bg, fg, selectbackground) listbox colors for the current mode."""
+    if is_dark_mode():
+        return (_DARK_BG, "#ffffff", "#1f6aa5")
+    return ("#ffffff", "#000000", "#1f6aa5")
+
+
 # ============================================================
 # Widget abstraction (factory functions)
 # ============================================================
 
 
+_theme_inited = False
+
+
 def get_root(title: str = "File Tab Opener") -> tk.Tk:
-    """Create the root window."""
+    """Create the root window.
+
+    Appearance mode and color theme are applied only on the first call;
+    setting the theme re-parses its JSON definition from disk.
+    """
+    global _theme_inited
     if CTK_AVAILABLE:
-        ctk.set_appearance_mode("system")
-        ctk.set_default_color_theme("blue")
+        if not _theme_inited:
+            ctk.set_appearance_mode("system")
+            ctk.set_default_color_theme("blue")
+            _theme_inited = True
         root = ctk.CTk()
     else:
         root = tk.Tk()
@@ -105,10 +157,9 @@ def Entry(parent: Any, **kw: Any) -> Any:
 # ============================================================
 
 
-def _strip_quotes(text: str) -> str:
-    """Strip matching surrounding quotes. Delegates to config.strip_quotes."""
-    from file_tab_opener.config import strip_quotes
-    return strip_quotes(text)
+# Strip matching surrounding quotes. Alias of config.strip_quotes, bound
+# once at import so hot entry-field handlers skip the per-call import.
+_strip_quotes = strip_quotes
 
 
 def _text_display_width(text: str) -> int:
@@ -121,8 +172,13 @@ def _text_display_width(text: str) -> int:
 
 
 def _setup_placeholder(entry: ttk.Entry, placeholder: str) -> None:
-    """Add placeholder text to a ttk.Entry (grey hint when empty)."""
+    """Add placeholder text to a ttk.Entry (grey hint when empty).
+
+    The text is stored on the widget (not closed over) so callers can
+    swap it in place, e.g. on a language change.
+    """
     entry._placeholder_active = True  # type: ignore[attr-defined]
+    entry._placeholder_text = placeholder  # type: ignore[attr-defined]
 
     def _on_focus_in(_event: Any) -> None:
         if entry._placeholder_active:  # type: ignore[attr-defined]
@@ -132,7 +188,7 @@ def _setup_placeholder(entry: ttk.Entry, placeholder: str) -> None:
 
     def _on_focus_out(_event: Any) -> None:
         if not entry.get():
-            entry.insert(0, placeholder)
+            entry.insert(0, entry._placeholder_text)  # type: ignore[attr-defined]
             entry.configure(foreground="grey")
             entry._placeholder_active = True  # type: ignore[attr-defined]
 
@@ -142,6 +198,23 @@ def _setup_placeholder(entry: ttk.Entry, placeholder: str) -> None:
     entry.bind("<FocusOut>", _on_focus_out, add="+")
 
 
+def _update_placeholder(entry: Any, placeholder: str) -> None:
+    """Swap a ttk.Entry placeholder text in place (e.g. on language change)."""
+    entry._placeholder_text = placeholder
+    if getattr(entry, "_placeholder_active", False):
+        entry.delete(0, tk.END)
+        entry.insert(0, placeholder)
+
+
+def _select_all_on_focus(event: Any) -> None:
+    """Shared FocusIn handler: select the entry's full contents.
+
+    Module-level so every entry binds the same function object instead
+    of allocating a closure per widget.
+    """
+    event.widget.selection_range(0, tk.END)
+
+
 def _is_placeholder_active(entry: Any) -> bool:
     """Check if the entry is currently showing placeholder text."""
     if CTK_AVAILABLE:
@@ -202,8 +275,8 @@ class TabView:
             (0, 0), window=self._inner, anchor="nw",
         )
 
-        self._row_frames: list[Any] = []
         self._buttons: dict[str, Any] = {}
+        self._width_cache: dict[str, int] = {}
         self._last_width: int = 0
         self._relayout_pending: bool = False
         self._rebuild_in_progress: bool = False
@@ -255,13 +328,21 @@ class TabView:
         self._rebuild()
 
     def rename_tab(self, old_name: str, new_name: str) -> None:
-        """Rename a tab."""
+        """Rename a tab. Reuses the existing button widget."""
         if old_name not in self._names or new_name in self._names:
             return
         idx = self._names.index(old_name)
         self._names[idx] = new_name
         if self._current == old_name:
             self._current = new_name
+        self._width_cache.pop(old_name, None)
+        btn = self._buttons.pop(old_name, None)
+        if btn is not None:
+            btn.configure(
+                text=new_name,
+                command=functools.partial(self._on_btn_click, new_name),
+            )
+            self._buttons[new_name] = btn
         self._rebuild()
 
     def get_current_tab_name(self) -> str | None:
@@ -287,9 +368,13 @@ class TabView:
             self._names.insert(new_index, item)
             self._rebuild()
 
-    def tab_names(self) -> list[str]:
-        """Return the list of tab names."""
-        return list(self._names)
+    def tab_names(self) -> Sequence[str]:
+        """Return the tab names in display order.
+
+        Returns the internal sequence without copying; callers must
+        treat it as read-only.
+        """
+        return self._names
 
     def scroll_to_current(self) -> None:
         """Scroll the canvas so that the current tab's button is visible."""
@@ -300,10 +385,9 @@ class TabView:
             # Force geometry to be fully calculated before reading positions
             self._frame.update_idletasks()
 
-            # btn.winfo_y() is relative to its parent (row_frame),
-            # so add the row_frame's y position within the inner frame.
-            row_frame = btn.master
-            btn_y = row_frame.winfo_y() + btn.winfo_y()
+            # Buttons are gridded directly on the inner frame, so
+            # btn.winfo_y() is already relative to it.
+            btn_y = btn.winfo_y()
             btn_h = btn.winfo_height()
             inner_h = self._inner.winfo_reqheight()
             canvas_h = self._canvas.winfo_height()
@@ -323,11 +407,11 @@ class TabView:
     # ---- internal ----
 
     def _rebuild(self) -> None:
-        """Destroy everything and schedule a fresh layout."""
+        """Schedule a fresh layout. Only newly seen names are measured."""
         self._rebuild_in_progress = True
-        self._clear_inner()
 
         if not self._names:
+            self._clear_inner()
             self._update_scroll(0)
             self._rebuild_in_progress = False
             return
@@ -335,18 +419,23 @@ class TabView:
         if not self._current or self._current not in self._names:
             self._current = self._names[0]
 
-        # Measure button widths using a temporary hidden button
-        self._btn_widths: list[tuple[str, int]] = []
-        for name in self._names:
-            w = self._estimate_btn_width(name)
-            self._btn_widths.append((name, w))
+        # Width estimates come from the per-name cache; only new names cost
+        self._btn_widths: list[tuple[str, int]] = [
+            (name, self._estimate_btn_width(name)) for name in self._names
+        ]
 
-        # Build the actual layout
-        self._frame.after_idle(self._relayout)
+        # Coalesce: a burst of add_tab calls (e.g. startup loading one
+        # tab per config group) results in a single layout pass at idle
+        if not self._relayout_pending:
+            self._relayout_pending = True
+            self._frame.after_idle(self._relayout)
 
     def _estimate_btn_width(self, name: str) -> int:
         """Estimate the pixel width a button needs for the given text.
 
+        Results are cached per name, so repeated relayouts only measure
+        names that have not been seen before.
+
         CTkButton is a composite widget (Canvas + internal Label) that
         cannot be reliably measured via winfo_reqwidth() on a temporary
         instance. Instead, measure the text width using CTkFont (the
@@ -354,6 +443,9 @@ class TabView:
 
         ttk.Button can be measured directly via a temporary widget.
         """
+        cached = self._width_cache.get(name)
+        if cached is not None:
+            return cached
         if CTK_AVAILABLE:
             # Use CTkFont to match the actual CTkButton font
             try:
@@ -363,19 +455,19 @@ class TabView:
                 # Fallback: CJK-aware character width estimation
                 text_w = _text_display_width(name) * 9
             # CTkButton chrome: 2 * corner_radius(6) + margin ≈ 14px
-            return max(text_w + 14, 50)
+            w = max(text_w + 14, 50)
         else:
             tmp = ttk.Button(self._inner, text=name)
             tmp.update_idletasks()
-            w = tmp.winfo_reqwidth()
+            w = max(tmp.winfo_reqwidth(), 40)
             tmp.destroy()
-            return max(w, 40)
+        self._width_cache[name] = w
+        return w
 
     def _clear_inner(self) -> None:
         """Destroy all child widgets inside the inner frame."""
         for child in self._inner.winfo_children():
             child.destroy()
-        self._row_frames.clear()
         self._buttons.clear()
 
     def _on_inner_configure(self, _event: Any) -> None:
@@ -459,17 +551,32 @@ class TabView:
         if dy != 0:
             self._canvas.yview_scroll(-dy, "units")
 
+    def _make_button(self, name: str) -> Any:
+        """Create a tab button as a direct child of the inner frame."""
+        if CTK_AVAILABLE:
+            return ctk.CTkButton(
+                self._inner, text=name,
+                width=0,  # fit to text (disable 140px default)
+                command=functools.partial(self._on_btn_click, name),
+                cursor="hand2",
+            )
+        return ttk.Button(
+            self._inner, text=name,
+            command=functools.partial(self._on_btn_click, name),
+        )
+
     def _relayout(self) -> None:
-        """Destroy and recreate buttons in wrapping rows (unlimited)."""
+        """Lay out buttons in wrapping rows (unlimited), reusing widgets.
+
+        Existing buttons are kept and re-gridded; only buttons for new
+        names are created and only buttons for removed names destroyed.
+        """
         self._relayout_pending = False
 
         if not self._names:
             self._rebuild_in_progress = False
             return
 
-        # Destroy old rows + buttons
-        self._clear_inner()
-
         available = self._canvas.winfo_width()
         if available <= 1:
             available = 10_000
@@ -480,6 +587,15 @@ class TabView:
                 (name, self._estimate_btn_width(name)) for name in self._names
             ]
 
+        # Sync the button dict with the current names (O(delta) churn)
+        current_names = set(self._names)
+        for name in list(self._buttons):
+            if name not in current_names:
+                self._buttons.pop(name).destroy()
+        for name in self._names:
+            if name not in self._buttons:
+                self._buttons[name] = self._make_button(name)
+
         # Split names into rows (greedy, unlimited rows)
         rows: list[list[str]] = []
         current_row: list[str] = []
@@ -497,30 +613,13 @@ class TabView:
         if current_row:
             rows.append(current_row)
 
-        # Create row frames and buttons as direct children of each row
-        for row_names in rows:
-            if self._dark_bg:
-                rf = tk.Frame(self._inner, bg=self._dark_bg)
-            else:
-                rf = ttk.Frame(self._inner)
-            rf.pack(fill=tk.X, pady=self._BTN_PAD_Y)
-            self._row_frames.append(rf)
-
-            for name in row_names:
-                if CTK_AVAILABLE:
-                    btn = ctk.CTkButton(
-                        rf, text=name,
-                        width=0,  # fit to text (disable 140px default)
-                        command=lambda n=name: self._on_btn_click(n),
-                        cursor="hand2",
-                    )
-                else:
-                    btn = ttk.Button(
-                        rf, text=name,
-                        command=lambda n=name: self._on_btn_click(n),
-                    )
-                btn.pack(side=tk.LEFT, padx=self._BTN_PAD_X, pady=0)
-                self._buttons[name] = btn
+        # Grid buttons row by row
+        for r, row_names in enumerate(rows):
+            for c, name in enumerate(row_names):
+                self._buttons[name].grid(
+                    row=r, column=c, sticky="w",
+                    padx=self._BTN_PAD_X, pady=self._BTN_PAD_Y,
+                )
 
         self._update_selection()
         self._update_scroll(len(rows))
@@ -568,6 +667,10 @@ class TabView:
 
     def _on_btn_click(self, name: str) -> None:
         """Handle button click."""
+        if name == self._current:
+            # Clicking the already-selected tab: nothing to change, and
+            # firing the callback would trigger a redundant refresh
+            return
         self._current = name
         self._update_selection()
         if self._on_tab_changed:
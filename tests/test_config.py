@@ -8,11 +8,14 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from pathlib import Path
 
 import pytest
 
-from file_tab_opener.config import AppConfig, ConfigManager, HistoryEntry, TabGroup, HISTORY_MAX
+from file_tab_opener.config import (
+    AppConfig, ConfigManager, HistoryEntry, TabGroup, HISTORY_MAX, _json_dumps,
+)
 
 
 # ============================================================
@@ -320,6 +323,24 @@ class TestTabGroups:
         tmp_config.add_path_to_group("Nonexistent", "C:\\test")
         # Should not raise
 
+    def test_add_paths_to_group_bulk(self, tmp_config: ConfigManager) -> None:
+        """Bulk add should normalize paths and skip duplicates."""
+        tmp_config.add_tab_group("Work")
+        tmp_config.add_path_to_group("Work", "C:/a")
+        tmp_config.add_paths_to_group("Work", ["C:/a", "C:/b", "C:/b", "C:/c"])
+        group = tmp_config.get_tab_group("Work")
+        assert group is not None
+        assert group.paths == [
+            os.path.normpath("C:/a"),
+            os.path.normpath("C:/b"),
+            os.path.normpath("C:/c"),
+        ]
+
+    def test_add_paths_to_nonexistent_group(self, tmp_config: ConfigManager) -> None:
+        """Bulk add to a non-existent group should be a no-op."""
+        tmp_config.add_paths_to_group("Nonexistent", ["C:\\test"])
+        # Should not raise
+
     def test_remove_path_from_group(self, tmp_config: ConfigManager) -> None:
         """Removing a path by index should work correctly."""
         tmp_config.add_tab_group("Work")
@@ -426,6 +447,92 @@ class TestCopyTabGroup:
         assert result is None
 
 
+# ============================================================
+# History queries (index / version counter)
+# ============================================================
+
+
+class TestHistoryQueries:
+    """Test the O(1) history lookup and the version counter."""
+
+    def test_has_history(self, tmp_config: ConfigManager) -> None:
+        """has_history should report stored (normalized) paths only."""
+        tmp_config.add_history(r"C:\test")
+        assert tmp_config.has_history(os.path.normpath(r"C:\test")) is True
+        assert tmp_config.has_history(os.path.normpath(r"C:\other")) is False
+
+    def test_history_version_bumps_on_mutation(self, tmp_config: ConfigManager) -> None:
+        """Every history mutation should advance history_version."""
+        v0 = tmp_config.history_version
+        tmp_config.add_history(r"C:\test")
+        v1 = tmp_config.history_version
+        assert v1 > v0
+        tmp_config.toggle_pin(r"C:\test")
+        v2 = tmp_config.history_version
+        assert v2 > v1
+        tmp_config.clear_history(keep_pinned=False)
+        assert tmp_config.history_version > v2
+
+
+# ============================================================
+# Background save (schedule_save / writer thread)
+# ============================================================
+
+
+class TestBackgroundSave:
+    """Test the asynchronous save path and write ordering."""
+
+    @staticmethod
+    def _wait_for(predicate, timeout: float = 5.0) -> bool:
+        """Poll until predicate() is true or the timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_schedule_save_persists_newest_snapshot(self, tmp_config: ConfigManager) -> None:
+        """Queued saves should eventually write the most recent state."""
+        tmp_config.add_history(r"C:\a")
+        tmp_config.schedule_save()
+        tmp_config.add_history(r"C:\b")
+        tmp_config.schedule_save()
+
+        def newest_on_disk() -> bool:
+            try:
+                data = json.loads(tmp_config.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return False
+            return len(data.get("history", [])) == 2
+
+        assert self._wait_for(newest_on_disk)
+
+    def test_sync_save_wins_over_stale_snapshot(self, tmp_config: ConfigManager) -> None:
+        """A stale queued snapshot must never clobber a newer save()."""
+        tmp_config.add_history(r"C:\old")
+        stale_raw = _json_dumps(tmp_config._to_dict())
+        stale_seq = tmp_config._save_seq + 1
+
+        tmp_config.add_history(r"C:\new")
+        tmp_config.save()  # consumes a later sequence number
+
+        # Replay the stale snapshot as the writer thread would; the
+        # sequence check must discard it
+        tmp_config._write_bytes(stale_raw, stale_seq)
+        data = json.loads(tmp_config.path.read_text(encoding="utf-8"))
+        paths = [e["path"] for e in data["history"]]
+        assert os.path.normpath(r"C:\new") in paths
+
+    def test_save_skips_unchanged_content(self, tmp_config: ConfigManager) -> None:
+        """Saving identical content twice should not rewrite the file."""
+        tmp_config.add_history(r"C:\test")
+        tmp_config.save()
+        mtime = tmp_config.path.stat().st_mtime_ns
+        tmp_config.save()
+        assert tmp_config.path.stat().st_mtime_ns == mtime
+
+
 # ============================================================
 # Serialization compatibility
 # ============================================================
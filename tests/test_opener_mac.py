@@ -1,6 +1,6 @@
 """Tests for opener_mac module.
 
-Covers: validate_paths (with mocked Path.is_dir), _build_applescript,
+Covers: validate_paths (with mocked os.path.isdir), _build_applescript,
 open_single_folder, open_folders_as_tabs, _esc_applescript.
 """
 
@@ -27,21 +27,21 @@ from file_tab_opener.opener_mac import (
 class TestValidatePaths:
     """Test validate_paths with mocked filesystem."""
 
-    @patch("file_tab_opener.Path.is_dir")
+    @patch("file_tab_opener.os.path.isdir")
     def test_all_valid(self, mock_is_dir) -> None:
         mock_is_dir.return_value = True
         valid, invalid = validate_paths(["/Users/test/Documents", "/Users/test/Downloads"])
         assert len(valid) == 2
         assert len(invalid) == 0
 
-    @patch("file_tab_opener.Path.is_dir")
+    @patch("file_tab_opener.os.path.isdir")
     def test_all_invalid(self, mock_is_dir) -> None:
         mock_is_dir.return_value = False
         valid, invalid = validate_paths(["/nonexistent/a", "/nonexistent/b"])
         assert len(valid) == 0
         assert len(invalid) == 2
 
-    @patch("file_tab_opener.Path.is_dir")
+    @patch("file_tab_opener.os.path.isdir")
     def test_mixed(self, mock_is_dir) -> None:
         mock_is_dir.side_effect = [True, False, True]
         valid, invalid = validate_paths(["/good/a", "/bad/b", "/good/c"])
@@ -54,7 +54,7 @@ class TestValidatePaths:
         assert valid == []
         assert invalid == []
 
-    @patch("file_tab_opener.Path.is_dir")
+    @patch("file_tab_opener.os.path.isdir")
     def test_expanduser(self, mock_is_dir) -> None:
         """Paths with ~ should be expanded."""
         mock_is_dir.return_value = True